@@ -1,19 +1,30 @@
 import argparse
 import sys
+from functools import lru_cache
+from pathlib import Path
 
 
 try:
-    from .file_processors import process_single_file
+    from .file_processors import process_files, process_single_file, process_source
     from .patterns import build_patterns_list
     from .utils import report_results
 except ImportError:
-    from file_processors import process_single_file
+    from file_processors import process_files, process_single_file, process_source
     from patterns import build_patterns_list
     from utils import report_results
 
 
-def parse_arguments():
-    """Parse command line arguments."""
+def _job_count(value: str) -> int:
+    """Parse a --jobs value, which is 0 (all CPUs) or a positive count."""
+    jobs = int(value)
+    if jobs < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {jobs}")
+    return jobs
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once and reuse it for every parse."""
     parser = argparse.ArgumentParser(description="Check for useless Spark actions")
     parser.add_argument("files", nargs="*", help="Files to check")
     parser.add_argument("--config", help="Configuration file (not implemented yet)")
@@ -27,30 +38,90 @@ def parse_arguments():
         action="store_true",
         help="Disable default patterns and only use additional ones",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=_job_count,
+        default=1,
+        help="Number of processes used to check files (0 uses all CPUs)",
+    )
+    return parser
 
 
-def main():
-    """Main entry point for the CLI."""
+def _is_existing_path(value: str) -> bool:
+    """Check if a command line value names an existing path.
+
+    Values that cannot be a path at all, such as patterns with a component
+    longer than the filesystem allows, are not paths.
+    """
+    try:
+        return Path(value).exists()
+    except (OSError, ValueError):
+        return False
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    args = _build_parser().parse_args()
+
+    # nargs="*" also consumes file names given after --additional-patterns,
+    # which is how pre-commit passes them. Existing paths are handed back to
+    # files first, since Windows drive paths contain a colon as well.
+    if args.additional_patterns:
+        patterns = []
+        for value in args.additional_patterns:
+            if _is_existing_path(value):
+                args.files.append(value)
+            else:
+                patterns.append(value)
+        args.additional_patterns = patterns
+
+    return args
+
+
+def parse_and_build():
+    """Parse command line arguments and build the patterns to check.
+
+    Returns:
+        Tuple of (files, patterns, jobs). Patterns are not built when no
+        files were given.
+    """
     args = parse_arguments()
 
     if not args.files:
-        print("No files provided")
-        return 0
+        return [], [], args.jobs
 
     patterns = build_patterns_list(
         disable_default_patterns=args.disable_default_patterns,
         additional_patterns=args.additional_patterns,
     )
+    return args.files, patterns, args.jobs
 
-    if not patterns:
-        print("No patterns to check")
-        return 0
+
+def run(patterns, files, sources=None, jobs=1) -> int:
+    """Check every file against the patterns and report the issues found.
+
+    Args:
+        patterns: List of (pattern, description) tuples
+        files: File names to check
+        sources: Optional mapping of file name to content; when given, the
+            content is checked in memory instead of being read from disk
+        jobs: Number of processes used to read and check files from disk;
+            0 uses all CPUs
+
+    Returns:
+        1 if any issue was found, 0 otherwise
+    """
+    if sources is not None:
+        results = (process_source(f, sources[f], patterns) for f in files)
+    elif jobs == 1:
+        results = (process_single_file(f, patterns) for f in files)
+    else:
+        results = process_files(files, patterns, jobs or None)
 
     total_issues = 0
 
-    for file_path in args.files:
-        issues = process_single_file(file_path, patterns)
+    for file_path, issues in zip(files, results):
         report_results(file_path, issues)
         total_issues += len(issues)
 
@@ -62,5 +133,20 @@ def main():
     return 0
 
 
+def main():
+    """Main entry point for the CLI."""
+    files, patterns, jobs = parse_and_build()
+
+    if not files:
+        print("No files provided")
+        return 0
+
+    if not patterns:
+        print("No patterns to check")
+        return 0
+
+    return run(patterns, files, jobs=jobs)
+
+
 if __name__ == "__main__":
     sys.exit(main())
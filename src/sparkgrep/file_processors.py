@@ -1,22 +1,31 @@
+import multiprocessing
+import os
+import re
 from pathlib import Path
 from typing import List, Tuple
 
 
 try:
     from .utils import (
-        check_line_for_patterns,
+        compile_pattern,
+        compile_union,
         is_docstring_line,
+        match_line,
         read_file_safely,
         should_skip_line,
         should_skip_notebook_line,
+        split_source_lines,
     )
 except ImportError:
     from utils import (
-        check_line_for_patterns,
+        compile_pattern,
+        compile_union,
         is_docstring_line,
+        match_line,
         read_file_safely,
         should_skip_line,
         should_skip_notebook_line,
+        split_source_lines,
     )
 
 
@@ -24,12 +33,23 @@ def check_python_file(
     file_path: Path, patterns: List[Tuple[str, str]]
 ) -> List[Tuple[int, str, str]]:
     """Check a Python file for useless Spark actions."""
+    # Nothing can match, so the file is not even read
+    if not patterns:
+        return []
+    return check_python_lines(read_file_safely(file_path), patterns)
+
+
+def check_python_lines(
+    lines: List[str], patterns: List[Tuple[str, str]]
+) -> List[Tuple[int, str, str]]:
+    """Check the lines of a Python source for useless Spark actions."""
     issues = []
-    lines = read_file_safely(file_path)
 
     if not lines:
         return issues
 
+    patterns = _compile_patterns(patterns)
+    union = compile_union(tuple(pattern for pattern, _ in patterns))
     in_docstring = False
     docstring_marker = None
 
@@ -44,15 +64,34 @@ def check_python_file(
             continue
 
         # Check line for pattern matches
-        matches = check_line_for_patterns(line, patterns)
+        matches = match_line(line, patterns, union)
         for description, line_content in matches:
             issues.append((line_num, description, line_content))
 
     return issues
 
 
+def _compile_patterns(patterns: List[Tuple[str, str]]) -> List[Tuple[re.Pattern, str]]:
+    """Compile the patterns once before scanning the lines of a file."""
+    return [
+        (compile_pattern(pattern), description) for pattern, description in patterns
+    ]
+
+
 def _read_notebook_safely(file_path: Path):
     """Read notebook file safely, handling import and parsing errors."""
+    try:
+        with open(file_path, encoding="utf-8") as f:
+            source = f.read()
+    except Exception as e:
+        print(f"Warning: Could not read notebook {file_path}: {e}")
+        return None
+
+    return _parse_notebook_safely(source, file_path)
+
+
+def _parse_notebook_safely(source: str, file_path):
+    """Parse notebook content safely, handling import and parsing errors."""
     try:
         import nbformat
     except ImportError:
@@ -60,8 +99,7 @@ def _read_notebook_safely(file_path: Path):
         return None
 
     try:
-        with open(file_path, encoding="utf-8") as f:
-            return nbformat.read(f, as_version=4)
+        return nbformat.reads(source, as_version=4)
     except Exception as e:
         print(f"Warning: Could not read notebook {file_path}: {e}")
         return None
@@ -76,12 +114,13 @@ def _process_notebook_cell(
     if cell.cell_type != "code":
         return issues
 
+    union = compile_union(tuple(pattern for pattern, _ in patterns))
     lines = cell.source.split("\n")
     for line_num, line in enumerate(lines, 1):
         if should_skip_notebook_line(line):
             continue
 
-        matches = check_line_for_patterns(line, patterns)
+        matches = match_line(line, patterns, union)
         for description, line_content in matches:
             location = f"Cell {cell_num + 1}, Line {line_num}"
             issues.append((location, description, line_content))
@@ -93,11 +132,32 @@ def check_notebook_file(
     file_path: Path, patterns: List[Tuple[str, str]]
 ) -> List[Tuple[str, str, str]]:
     """Check a Jupyter notebook file for useless Spark actions."""
-    issues = []
-
+    if not patterns:
+        return []
     notebook = _read_notebook_safely(file_path)
     if notebook is None:
-        return issues
+        return []
+
+    return _check_notebook(notebook, patterns)
+
+
+def check_notebook_source(
+    source: str, patterns: List[Tuple[str, str]], file_name: str = "<notebook>"
+) -> List[Tuple[str, str, str]]:
+    """Check the JSON source of a Jupyter notebook for useless Spark actions."""
+    if not patterns:
+        return []
+    notebook = _parse_notebook_safely(source, file_name)
+    if notebook is None:
+        return []
+
+    return _check_notebook(notebook, patterns)
+
+
+def _check_notebook(notebook, patterns: List[Tuple[str, str]]):
+    """Check the code cells of a parsed notebook."""
+    issues = []
+    patterns = _compile_patterns(patterns)
 
     for cell_num, cell in enumerate(notebook.cells):
         cell_issues = _process_notebook_cell(cell, cell_num, patterns)
@@ -120,3 +180,58 @@ def process_single_file(
     if file_path.suffix == ".ipynb":
         return check_notebook_file(file_path, patterns)
     return []
+
+
+def process_files(
+    file_paths: List[str], patterns: List[Tuple[str, str]], jobs: int = None
+) -> List[List[Tuple[str, str, str]]]:
+    """Process several files in worker processes.
+
+    Args:
+        file_paths: Files to check
+        patterns: List of (pattern, description) tuples
+        jobs: Number of worker processes, all CPUs when None
+
+    Returns:
+        The issues of each file, in the order of file_paths
+    """
+    jobs = min(jobs or os.cpu_count() or 1, len(file_paths))
+    if jobs < 2:
+        return [process_single_file(file_path, patterns) for file_path in file_paths]
+
+    # A few chunks per worker keeps the pickling overhead low while still
+    # balancing files of different sizes
+    chunksize = max(1, len(file_paths) // (jobs * 4))
+    with multiprocessing.Pool(
+        jobs, initializer=_init_worker, initargs=(patterns,)
+    ) as pool:
+        return pool.map(_process_in_worker, file_paths, chunksize)
+
+
+# State of the current worker process, set once by _init_worker
+_worker_state = {}
+
+
+def _init_worker(patterns: List[Tuple[str, str]]) -> None:
+    """Receive and compile the patterns once per worker process."""
+    _worker_state["patterns"] = _compile_patterns(patterns)
+
+
+def _process_in_worker(file_path: str) -> List[Tuple[str, str, str]]:
+    """Process a file with the patterns given to this worker."""
+    return process_single_file(file_path, _worker_state["patterns"])
+
+
+def process_source(
+    file_name: str, source: str, patterns: List[Tuple[str, str]]
+) -> List[Tuple[str, str, str]]:
+    """Process in-memory content as if it had been read from file_name."""
+    if not patterns:
+        return []
+    suffix = Path(file_name).suffix
+
+    if suffix == ".py":
+        return check_python_lines(split_source_lines(source), patterns)
+    if suffix == ".ipynb":
+        return check_notebook_source(source, patterns, file_name)
+    return []
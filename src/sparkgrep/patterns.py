@@ -1,8 +1,10 @@
-from typing import List, Tuple
+import re
+from typing import List, Tuple, Union
 
 
-# Patterns to detect useless Spark actions
-USELESS_PATTERNS = [
+# Patterns to detect useless Spark actions. A tuple, so the shared defaults
+# cannot be changed through a reference to them.
+USELESS_PATTERNS = (
     # display() function calls.
     (r"\s*display\s*\(", "display() function or method call"),
     # .show() method calls (debugging leftover)
@@ -15,7 +17,33 @@ USELESS_PATTERNS = [
     (r"^\s*\w+\.toPandas\s*\(\s*\)\s*$", ".toPandas() without assignment"),
     # dbutils.notebook.exit() without parameters (debugging leftover)
     (r"dbutils\.notebook\.exit\s*\(\s*\)", "dbutils.notebook.exit() call"),
-]
+)
+
+
+def _parse_additional_pattern(pattern_desc: str) -> Union[Tuple[str, str], None]:
+    """Parse a 'pattern:description' value.
+
+    Returns:
+        The (pattern, description) tuple, or None with a warning when the
+        format or the regex is invalid
+    """
+    pattern, separator, description = pattern_desc.partition(":")
+    if not separator:
+        # TODO replace with log warning.
+        print(
+            f"""
+            Warning: Invalid pattern format '{pattern_desc}'.
+            Use 'pattern:description'
+            """
+        )
+        return None
+
+    try:
+        re.compile(pattern)
+    except re.error as e:
+        print(f"Warning: Invalid regex '{pattern}' skipped: {e}")
+        return None
+    return pattern, description
 
 
 def build_patterns_list(
@@ -30,25 +58,12 @@ def build_patterns_list(
     Returns:
         List of (pattern, description) tuples
     """
-    patterns = []
-
     # Add default patterns unless disabled
-    if not disable_default_patterns:
-        patterns.extend(USELESS_PATTERNS)
+    patterns = [] if disable_default_patterns else list(USELESS_PATTERNS)
 
-    # Add additional patterns
+    # Add additional patterns, built in one pass and added with a single extend
     if additional_patterns:
-        for pattern_desc in additional_patterns:
-            if ":" in pattern_desc:
-                pattern, description = pattern_desc.split(":", 1)
-                patterns.append((pattern, description))
-            else:
-                # TODO replace with log warning.
-                print(
-                    f"""
-                    Warning: Invalid pattern format '{pattern_desc}'.
-                    Use 'pattern:description'
-                    """
-                )
+        parsed = [_parse_additional_pattern(value) for value in additional_patterns]
+        patterns.extend(pattern for pattern in parsed if pattern is not None)
 
     return patterns
@@ -1,13 +1,38 @@
+import io
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple, Union
 
 
+# Characters that end the literal prefix of a regex
+_REGEX_META = frozenset(".^$*+?{}[]|()\\")
+
+# Plain int, so testing pattern.flags skips the enum operator overhead
+_IGNORECASE = re.IGNORECASE.value
+
+# Back-references and conditionals, which depend on group numbering
+_GROUP_REFERENCE = re.compile(r"\\\d|\(\?P=|\(\?\(")
+
+# Inline global flags, which Python < 3.11 applies to every alternative
+_INLINE_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+def split_source_lines(text: str) -> List[str]:
+    r"""Split source text into lines the way reading a text file does.
+
+    Only \n, \r\n and \r end a line and are normalized to \n.
+    str.splitlines would also split on form feeds and other separators,
+    shifting the reported line numbers.
+    """
+    return io.StringIO(text, newline=None).readlines()
+
+
 def read_file_safely(file_path: Path) -> List[str]:
     """Read file content safely, handling encoding errors."""
     try:
-        with open(file_path, encoding="utf-8") as f:
-            return f.readlines()
+        # One read for the whole file, split in memory
+        return split_source_lines(Path(file_path).read_bytes().decode("utf-8"))
     except FileNotFoundError:
         return []
     except UnicodeDecodeError:
@@ -53,13 +78,157 @@ def should_skip_notebook_line(line: str) -> bool:
     return stripped_line.startswith("#") or stripped_line.startswith("%")
 
 
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: Union[str, re.Pattern]) -> re.Pattern:
+    """Compile a pattern once and reuse it across lines and files.
+
+    Already compiled patterns are returned unchanged, keeping their own flags.
+    """
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _compiles_alone(source: str) -> bool:
+    """Check that a regex source is valid on its own, outside any union."""
+    try:
+        compile_pattern(source)
+    except re.error:
+        return False
+    return True
+
+
+def _union_source(pattern: Union[str, re.Pattern]) -> Union[str, None]:
+    """Return the regex source a pattern contributes to a union, if any."""
+    if isinstance(pattern, re.Pattern):
+        if pattern.flags != re.IGNORECASE | re.UNICODE:
+            return None
+        source = pattern.pattern
+    else:
+        source = pattern
+    # Wrapping in a group could make an unbalanced source such as a)|(b valid
+    if not isinstance(source, str) or not _compiles_alone(source):
+        return None
+    if _GROUP_REFERENCE.search(source) or _INLINE_FLAGS.search(source):
+        return None
+    return source
+
+
+@lru_cache(maxsize=64)
+def compile_union(
+    patterns: Tuple[Union[str, re.Pattern], ...],
+) -> Union[re.Pattern, None]:
+    """Compile several patterns into one alternation regex.
+
+    The union rejects lines that match none of the patterns in a single scan.
+    Each pattern is wrapped in a group named _p<index>, so the lastgroup of
+    a match tells which pattern matched first. Precompiled patterns are
+    included when they use the same case-insensitive flags as string
+    patterns. Returns None when the patterns cannot be combined safely (other
+    flags, inline global flags, group references or invalid regex).
+    """
+    if len(patterns) < 2:
+        return None
+    sources = [_union_source(pattern) for pattern in patterns]
+    if None in sources:
+        return None
+    try:
+        union = "|".join(f"(?P<_p{i}>{p})" for i, p in enumerate(sources))
+        return re.compile(union, re.IGNORECASE)
+    except re.error:
+        return None
+
+
+def _literal_at(source: str, index: int) -> Tuple[Union[str, None], int]:
+    """Return the literal character at index and its length in the source."""
+    char = source[index]
+    if char != "\\":
+        return (None if char in _REGEX_META else char), 1
+
+    # Escaped punctuation is literal, escaped letters are classes or anchors
+    char = source[index + 1 : index + 2]
+    if not char or char.isalnum() or char == "_":
+        return None, 2
+    return char, 2
+
+
+def _prefix_chars(source: str):
+    """Yield the literal characters a regex source starts with."""
+    index = 0
+    while index < len(source):
+        char, step = _literal_at(source, index)
+        quantifier = source[index + step : index + step + 1]
+        if char is None or quantifier in ("*", "?", "{"):
+            return
+        yield char
+        if quantifier == "+":
+            return
+        index += step
+
+
+@lru_cache(maxsize=256)
+def literal_prefix(pattern: re.Pattern) -> str:
+    """Return the literal text every match of a compiled pattern starts with.
+
+    Lines that do not contain it can be rejected with a substring test
+    instead of a regex search. The prefix is lowercased for case-insensitive
+    patterns. Returns an empty string when no prefix can be derived safely.
+    """
+    source = pattern.pattern
+    if not isinstance(source, str) or "|" in source or pattern.flags & re.VERBOSE:
+        return ""
+
+    literal = "".join(_prefix_chars(source))
+    if not pattern.flags & re.IGNORECASE:
+        return literal
+    # Case-insensitive regexes also fold some non-ASCII characters
+    return literal.lower() if literal.isascii() else ""
+
+
+def _may_match(pattern: re.Pattern, line: str, lowered: Union[str, None]) -> bool:
+    """Check whether the line contains the literal prefix of the pattern.
+
+    lowered is the lowercased line, or None when the line is not ASCII and
+    the substring test would not be exact.
+    """
+    literal = literal_prefix(pattern)
+    if not literal or lowered is None:
+        return True
+    return literal in (lowered if pattern.flags & _IGNORECASE else line)
+
+
 def check_line_for_patterns(
     line: str, patterns: List[Tuple[str, str]]
 ) -> List[Tuple[str, str]]:
     """Check a single line against all patterns and return matches."""
+    union = compile_union(tuple(pattern for pattern, _ in patterns))
+    return match_line(line, patterns, union)
+
+
+def match_line(
+    line: str, patterns: List[Tuple[str, str]], union: Union[re.Pattern, None]
+) -> List[Tuple[str, str]]:
+    """Check a single line against patterns whose union is already built.
+
+    Same as check_line_for_patterns, for callers that check many lines
+    against the same patterns and build the union once with compile_union.
+    """
+    # The pattern found by the union scan needs no search of its own
+    known = None
+    if union is not None:
+        hit = union.search(line)
+        if hit is None:
+            return []
+        known = int(hit.lastgroup[2:])
+
+    lowered = line.lower() if line.isascii() else None
+
     matches = []
-    for pattern, description in patterns:
-        if re.search(pattern, line, re.IGNORECASE):
+    for index, (pattern, description) in enumerate(patterns):
+        compiled = compile_pattern(pattern)
+        if index == known or (
+            _may_match(compiled, line, lowered) and compiled.search(line)
+        ):
             matches.append((description, line.strip()))
     return matches
 
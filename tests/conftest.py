@@ -0,0 +1,31 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+
+def pytest_configure(config):
+    """Keep pytest's temporary directories in RAM on Linux when asked to.
+
+    Opt in with SPARKGREP_TEST_TMPFS=1. /dev/shm is often small in
+    containers, and notebooks linked from tests/fixtures are copied instead
+    of hard-linked there, so it is not used by default. An explicit TMPDIR
+    always wins.
+    """
+    if (
+        os.environ.get("SPARKGREP_TEST_TMPFS") == "1"
+        and sys.platform.startswith("linux")
+        and "TMPDIR" not in os.environ
+        and os.access("/dev/shm", os.W_OK)
+    ):
+        os.environ["TMPDIR"] = "/dev/shm"
+        tempfile.tempdir = None
+
+
+@pytest.fixture(scope="session")
+def display_py_file(tmp_path_factory):
+    """Python file with a single display() call, shared read-only by the session."""
+    path = tmp_path_factory.mktemp("shared") / "display.py"
+    path.write_text("display(df)")
+    return path
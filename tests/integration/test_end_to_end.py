@@ -3,15 +3,13 @@ End-to-end integration tests for the complete sparkgrep workflow.
 """
 
 import pytest
-import tempfile
-import os
 import json
 
 from sparkgrep.patterns import build_patterns_list
 from sparkgrep.file_processors import process_single_file
 
 
-def test_full_workflow_python_file_with_issues():
+def test_full_workflow_python_file_with_issues(tmp_path):
     """Test complete workflow with Python file containing issues."""
     python_code = """
     def test_function():
@@ -24,28 +22,23 @@ def test_full_workflow_python_file_with_issues():
         return result
     """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    try:
-        # Test using the complete workflow
-        patterns = build_patterns_list()
-        issues = process_single_file(temp_path, patterns)
+    # Test using the complete workflow
+    patterns = build_patterns_list()
+    issues = process_single_file(temp_path, patterns)
 
-        # Should find multiple issues
-        assert len(issues) >= 4  # At least display, show, collect, count, toPandas
+    # Should find multiple issues
+    assert len(issues) >= 4  # At least display, show, collect, count, toPandas
 
-        # Check specific issues
-        issue_descriptions = [issue[1] for issue in issues]
-        assert any("display" in desc for desc in issue_descriptions)
-        assert any("show" in desc for desc in issue_descriptions)
-
-    finally:
-        os.unlink(temp_path)
+    # Check specific issues
+    issue_descriptions = [issue[1] for issue in issues]
+    assert any("display" in desc for desc in issue_descriptions)
+    assert any("show" in desc for desc in issue_descriptions)
 
 @pytest.mark.skip(reason = "Test is failing. Fix later.")
-def test_full_workflow_notebook_with_issues():
+def test_full_workflow_notebook_with_issues(tmp_path):
     """Test complete workflow with Jupyter notebook containing issues."""
     notebook_content = {
         "cells": [
@@ -77,32 +70,27 @@ def test_full_workflow_notebook_with_issues():
         "nbformat_minor": 2,
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook_content, f)
-        temp_path = f.name
-
-    try:
-        patterns = build_patterns_list()
-        issues = process_single_file(temp_path, patterns)
+    temp_path = tmp_path / "snip.ipynb"
+    temp_path.write_text(json.dumps(notebook_content))
 
-        # Should find 2 issues (display and show)
-        assert len(issues) == 2
+    patterns = build_patterns_list()
+    issues = process_single_file(temp_path, patterns)
 
-        # Check specific issues
-        issue_descriptions = [issue[1] for issue in issues]
-        assert any("display" in desc for desc in issue_descriptions)
-        assert any("show" in desc for desc in issue_descriptions)
+    # Should find 2 issues (display and show)
+    assert len(issues) == 2
 
-        # Check cell locations
-        locations = [issue[0] for issue in issues]
-        assert "Cell 2, Line 1" in locations
-        assert "Cell 3, Line 1" in locations
+    # Check specific issues
+    issue_descriptions = [issue[1] for issue in issues]
+    assert any("display" in desc for desc in issue_descriptions)
+    assert any("show" in desc for desc in issue_descriptions)
 
-    finally:
-        os.unlink(temp_path)
+    # Check cell locations
+    locations = [issue[0] for issue in issues]
+    assert "Cell 2, Line 1" in locations
+    assert "Cell 3, Line 1" in locations
 
 
-def test_full_workflow_no_issues():
+def test_full_workflow_no_issues(tmp_path):
     """Test complete workflow with clean files."""
     python_code = '''
 def test_function():
@@ -116,22 +104,17 @@ def test_function():
     return result
 '''
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        patterns = build_patterns_list()
-        issues = process_single_file(temp_path, patterns)
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-        # Should find no issues
-        assert len(issues) == 0
+    patterns = build_patterns_list()
+    issues = process_single_file(temp_path, patterns)
 
-    finally:
-        os.unlink(temp_path)
+    # Should find no issues
+    assert len(issues) == 0
 
 
-def test_custom_patterns_integration():
+def test_custom_patterns_integration(tmp_path):
     """Test integration with custom patterns."""
     python_code = """
 def test_function():
@@ -140,26 +123,21 @@ def test_function():
     print("hello")
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    try:
-        # Test with custom patterns
-        patterns = build_patterns_list(
-            disable_default_patterns=False,
-            additional_patterns=[
-                "custom_debug_function:Custom debug function",
-            ],
-        )
-
-        issues = process_single_file(temp_path, patterns)
+    # Test with custom patterns
+    patterns = build_patterns_list(
+        disable_default_patterns=False,
+        additional_patterns=[
+            "custom_debug_function:Custom debug function",
+        ],
+    )
 
-        # Should find multiple issues (default + custom)
-        assert len(issues) >= 2
+    issues = process_single_file(temp_path, patterns)
 
-        issue_descriptions = [issue[1] for issue in issues]
-        assert any("display" in desc for desc in issue_descriptions)
+    # Should find multiple issues (default + custom)
+    assert len(issues) >= 2
 
-    finally:
-        os.unlink(temp_path)
+    issue_descriptions = [issue[1] for issue in issues]
+    assert any("display" in desc for desc in issue_descriptions)
@@ -2,9 +2,6 @@
 Integration tests for error handling scenarios.
 """
 
-import pytest
-import tempfile
-import os
 from unittest.mock import patch
 
 from sparkgrep.cli import main
@@ -19,7 +16,7 @@ def test_nonexistent_file_handling():
         assert result == 0  # Should succeed (no files processed)
 
 
-def test_mixed_existent_nonexistent_files():
+def test_mixed_existent_nonexistent_files(tmp_path):
     """Test handling of mix of existent and nonexistent files."""
     python_code = """
 def test_function():
@@ -27,53 +24,38 @@ def test_function():
     print("hello")
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    try:
-        test_argv = ["check-spark-actions", temp_path, "nonexistent.py"]
+    test_argv = ["check-spark-actions", str(temp_path), "nonexistent.py"]
 
-        with patch("sys.argv", test_argv):
-            result = main()
-            assert result == 1  # Should fail due to issues in existing file
-
-    finally:
-        os.unlink(temp_path)
+    with patch("sys.argv", test_argv):
+        result = main()
+        assert result == 1  # Should fail due to issues in existing file
 
 
-def test_empty_files_handling():
+def test_empty_files_handling(tmp_path):
     """Test handling of empty files."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write("")  # Empty file
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.touch()
 
-    try:
-        test_argv = ["check-spark-actions", temp_path]
+    test_argv = ["check-spark-actions", str(temp_path)]
 
-        with patch("sys.argv", test_argv):
-            result = main()
-            assert result == 0  # Should succeed (no issues in empty file)
-
-    finally:
-        os.unlink(temp_path)
+    with patch("sys.argv", test_argv):
+        result = main()
+        assert result == 0  # Should succeed (no issues in empty file)
 
 
-def test_invalid_notebook_handling():
+def test_invalid_notebook_handling(tmp_path):
     """Test handling of invalid notebook files."""
     # Create invalid notebook
     invalid_notebook = "This is not valid JSON"
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        f.write(invalid_notebook)
-        temp_path = f.name
-
-    try:
-        test_argv = ["check-spark-actions", temp_path]
+    temp_path = tmp_path / "snip.ipynb"
+    temp_path.write_text(invalid_notebook)
 
-        with patch("sys.argv", test_argv):
-            result = main()
-            assert result == 0  # Should succeed (no files processed due to error)
+    test_argv = ["check-spark-actions", str(temp_path)]
 
-    finally:
-        os.unlink(temp_path)
+    with patch("sys.argv", test_argv):
+        result = main()
+        assert result == 0  # Should succeed (no files processed due to error)
@@ -2,15 +2,12 @@
 Integration tests for pre-commit hook scenarios.
 """
 
-import pytest
-import tempfile
-import os
 from unittest.mock import patch
 
 from sparkgrep.cli import main
 
 
-def test_pre_commit_hook_success_scenario():
+def test_pre_commit_hook_success_scenario(tmp_path):
     """Test successful pre-commit hook execution (no issues)."""
     python_code = """
 def clean_function():
@@ -20,23 +17,18 @@ def clean_function():
     return result
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    try:
-        # Simulate pre-commit hook call
-        test_argv = ["check-spark-actions", temp_path]
+    # Simulate pre-commit hook call
+    test_argv = ["check-spark-actions", str(temp_path)]
 
-        with patch("sys.argv", test_argv):
-            result = main()
-            assert result == 0  # Success
+    with patch("sys.argv", test_argv):
+        result = main()
+        assert result == 0  # Success
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_pre_commit_hook_failure_scenario():
+def test_pre_commit_hook_failure_scenario(tmp_path):
     """Test pre-commit hook failure (issues found)."""
     python_code = """
 def problematic_function():
@@ -45,23 +37,18 @@ def problematic_function():
     return None
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        # Simulate pre-commit hook call
-        test_argv = ["check-spark-actions", temp_path]
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-        with patch("sys.argv", test_argv):
-            result = main()
-            assert result == 1  # Failure
+    # Simulate pre-commit hook call
+    test_argv = ["check-spark-actions", str(temp_path)]
 
-    finally:
-        os.unlink(temp_path)
+    with patch("sys.argv", test_argv):
+        result = main()
+        assert result == 1  # Failure
 
 
-def test_pre_commit_hook_with_options():
+def test_pre_commit_hook_with_options(tmp_path):
     """Test pre-commit hook with command-line options."""
     python_code = """
 def test_function():
@@ -70,23 +57,18 @@ def test_function():
     print("hello")
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        # Test with disabled default patterns and custom pattern
-        test_argv = [
-            "check-spark-actions",
-            temp_path,
-            "--disable-default-patterns",
-            "--additional-patterns",
-            r"custom_debug\s*\(\s*\):Custom debug function",
-        ]
-
-        with patch("sys.argv", test_argv):
-            result = main()
-            assert result == 1  # Should fail due to custom pattern match
-
-    finally:
-        os.unlink(temp_path)
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
+
+    # Test with disabled default patterns and custom pattern
+    test_argv = [
+        "check-spark-actions",
+        str(temp_path),
+        "--disable-default-patterns",
+        "--additional-patterns",
+        r"custom_debug\s*\(\s*\):Custom debug function",
+    ]
+
+    with patch("sys.argv", test_argv):
+        result = main()
+        assert result == 1  # Should fail due to custom pattern match
@@ -0,0 +1,84 @@
+import ast
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from sparkgrep import cli
+from sparkgrep.patterns import build_patterns_list
+from sparkgrep.utils import compile_pattern
+
+
+CLI_TESTS_DIR = Path(__file__).parent
+
+
+def _calls_subprocess(path):
+    """Return True if the module calls anything on the subprocess module."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    return any(
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == "subprocess"
+        for node in ast.walk(tree)
+    )
+
+
+def pytest_collection_modifyitems(items):
+    """Keep CLI unit tests in-process by rejecting subprocess calls."""
+    paths = {item.path for item in items}
+    for path in sorted(paths):
+        if CLI_TESTS_DIR in path.parents and _calls_subprocess(path):
+            raise pytest.UsageError(
+                f"{path}: CLI unit tests must call main() in-process, "
+                "not through subprocess"
+            )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_pattern_cache():
+    """Compile the default patterns once before any CLI test runs."""
+    for pattern, _ in build_patterns_list():
+        compile_pattern(pattern)
+
+
+@pytest.fixture
+def make_args():
+    """Factory for parsed-argument mocks as returned by ``parse_arguments``."""
+
+    def _mk(files=(), disable=False, additional=None, config=None, jobs=1):
+        # spec= keeps MagicMock from auto-generating attributes on access
+        m = MagicMock(
+            spec=[
+                "files",
+                "disable_default_patterns",
+                "additional_patterns",
+                "config",
+                "jobs",
+            ]
+        )
+        m.files = list(files)
+        m.disable_default_patterns = disable
+        m.additional_patterns = additional
+        m.config = config
+        m.jobs = jobs
+        return m
+
+    return _mk
+
+
+@pytest.fixture
+def cli_mocks(monkeypatch):
+    """Replace the collaborators of ``sparkgrep.cli.main`` with mocks."""
+    m = SimpleNamespace(
+        parse=MagicMock(),
+        build=MagicMock(),
+        proc=MagicMock(),
+        report=MagicMock(),
+    )
+    monkeypatch.setattr(cli, "parse_arguments", m.parse)
+    monkeypatch.setattr(cli, "build_patterns_list", m.build)
+    monkeypatch.setattr(cli, "process_single_file", m.proc)
+    monkeypatch.setattr(cli, "report_results", m.report)
+    return m
@@ -1,35 +1,28 @@
 import pytest
-import tempfile
 import os
 import json
-from unittest.mock import patch
-from pathlib import Path
+import sys
 
 from sparkgrep.cli import main
 
 
-def test_main_with_corrupted_notebook():
+def test_main_with_corrupted_notebook(tmp_path, monkeypatch):
     """Test main function with corrupted notebook file."""
     corrupted_json = '{"nbformat": 4, "cells": [invalid json'
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        f.write(corrupted_json)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.ipynb"
+    temp_path.write_text(corrupted_json)
 
-    try:
-        test_argv = ["sparkgrep", temp_path]
-
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = ["sparkgrep", str(temp_path)]
 
-        # Should handle corrupted notebooks gracefully
-        assert result == 0  # No issues found in corrupted file
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        os.unlink(temp_path)
+    # Should handle corrupted notebooks gracefully
+    assert result == 0  # No issues found in corrupted file
 
 
-def test_main_with_very_large_files():
+def test_main_with_very_large_files(tmp_path, monkeypatch):
     """Test main function with very large files."""
     # Create a large file
     lines = []
@@ -41,200 +34,161 @@ def test_main_with_very_large_files():
 
     large_content = "\n".join(lines)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(large_content)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(large_content)
 
-    try:
-        test_argv = ["sparkgrep", temp_path]
+    test_argv = ["sparkgrep", str(temp_path)]
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-        assert result == 1  # Should find issues even in large files
+    assert result == 1  # Should find issues even in large files
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_main_with_unicode_filenames():
+def test_main_with_unicode_filenames(tmp_path, monkeypatch):
     """Test main function with unicode characters in filenames."""
     python_code = "display(df)"
 
-    # Note: tempfile handling of unicode names varies by system
-    with tempfile.NamedTemporaryFile(mode="w", suffix="_unicode_test.py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        test_argv = ["sparkgrep", temp_path]
+    temp_path = tmp_path / "snip_unicode_test.py"
+    temp_path.write_text(python_code)
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = ["sparkgrep", str(temp_path)]
 
-        assert result == 1  # Should find the display call
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        os.unlink(temp_path)
+    assert result == 1  # Should find the display call
 
 
-def test_main_with_special_characters_in_paths():
+def test_main_with_special_characters_in_paths(tmp_path, monkeypatch):
     """Test main function with special characters in file paths."""
     python_code = "display(df)"
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix="_special!@#$%^&()_test.py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        test_argv = ["sparkgrep", temp_path]
+    temp_path = tmp_path / "snip_special!@#$%^&()_test.py"
+    temp_path.write_text(python_code)
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = ["sparkgrep", str(temp_path)]
 
-        assert result == 1  # Should handle special characters in paths
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        os.unlink(temp_path)
+    assert result == 1  # Should handle special characters in paths
 
 
-def test_main_with_binary_files():
+def test_main_with_binary_files(tmp_path, monkeypatch):
     """Test main function with binary files that have supported extensions."""
     # Create a binary file with .py extension
     binary_content = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00'
 
-    with tempfile.NamedTemporaryFile(mode="wb", suffix=".py", delete=False) as f:
-        f.write(binary_content)
-        temp_path = f.name
-
-    try:
-        test_argv = ["sparkgrep", temp_path]
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_bytes(binary_content)
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = ["sparkgrep", str(temp_path)]
 
-        # Should handle binary files gracefully
-        assert result == 0  # No issues found in binary file
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        os.unlink(temp_path)
+    # Should handle binary files gracefully
+    assert result == 0  # No issues found in binary file
 
 
-def test_main_with_deeply_nested_directory():
+def test_main_with_deeply_nested_directory(tmp_path, monkeypatch):
     """Test main function with files in deeply nested directories."""
     python_code = "display(df)"
 
-    # Create file in a temporary directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        nested_path = Path(temp_dir) / "very" / "deeply" / "nested" / "directory"
-        nested_path.mkdir(parents=True, exist_ok=True)
+    nested_path = tmp_path / "very" / "deeply" / "nested" / "directory"
+    nested_path.mkdir(parents=True, exist_ok=True)
 
-        file_path = nested_path / "test_file.py"
-        file_path.write_text(python_code)
+    file_path = nested_path / "test_file.py"
+    file_path.write_text(python_code)
 
-        test_argv = ["sparkgrep", str(file_path)]
+    test_argv = ["sparkgrep", str(file_path)]
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-        assert result == 1  # Should find the display call
+    assert result == 1  # Should find the display call
 
 
-def test_main_with_readonly_files():
+def test_main_with_readonly_files(tmp_path, monkeypatch):
     """Test main function with read-only files."""
     python_code = "display(df)"
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    try:
-        # Make file read-only
-        os.chmod(temp_path, 0o444)
-
-        test_argv = ["sparkgrep", temp_path]
+    # Make file read-only
+    os.chmod(temp_path, 0o444)
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = ["sparkgrep", str(temp_path)]
 
-        assert result == 1  # Should still be able to read and find issues
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        # Restore write permissions for cleanup
-        os.chmod(temp_path, 0o644)
-        os.unlink(temp_path)
+    assert result == 1  # Should still be able to read and find issues
 
 
-def test_main_with_symlinks():
+def test_main_with_symlinks(tmp_path, monkeypatch):
     """Test main function with symbolic links."""
     python_code = "display(df)"
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create original file
-        original_file = Path(temp_dir) / "original.py"
-        original_file.write_text(python_code)
+    # Create original file
+    original_file = tmp_path / "original.py"
+    original_file.write_text(python_code)
 
-        # Create symlink
-        symlink_file = Path(temp_dir) / "symlink.py"
-        try:
-            symlink_file.symlink_to(original_file)
-        except OSError:
-            # Symlinks might not be supported on all systems
-            pytest.skip("Symlinks not supported on this system")
+    # Create symlink
+    symlink_file = tmp_path / "symlink.py"
+    try:
+        symlink_file.symlink_to(original_file)
+    except OSError:
+        # Symlinks might not be supported on all systems
+        pytest.skip("Symlinks not supported on this system")
 
-        test_argv = ["sparkgrep", str(symlink_file)]
+    test_argv = ["sparkgrep", str(symlink_file)]
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-        assert result == 1  # Should follow symlink and find issues
+    assert result == 1  # Should follow symlink and find issues
 
 
-def test_main_with_mixed_valid_invalid_files():
+def test_main_with_mixed_valid_invalid_files(tmp_path, monkeypatch):
     """Test main function with a mix of valid and invalid files."""
     # Create valid Python file
     valid_code = "display(df)"
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(valid_code)
-        valid_path = f.name
+    valid_path = tmp_path / "snip.py"
+    valid_path.write_text(valid_code)
 
     # Create corrupted notebook
     corrupted_json = '{"nbformat": 4, "cells": [invalid'
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        f.write(corrupted_json)
-        corrupt_path = f.name
-
-    try:
-        test_argv = ["sparkgrep", valid_path, corrupt_path, "nonexistent.py"]
+    corrupt_path = tmp_path / "snip.ipynb"
+    corrupt_path.write_text(corrupted_json)
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = ["sparkgrep", str(valid_path), str(corrupt_path), "nonexistent.py"]
 
-        # Should process valid file and handle invalid files gracefully
-        assert result == 1  # Should find issue in valid file
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        os.unlink(valid_path)
-        os.unlink(corrupt_path)
+    # Should process valid file and handle invalid files gracefully
+    assert result == 1  # Should find issue in valid file
 
 
-def test_main_nonexistent_files():
+def test_main_nonexistent_files(monkeypatch):
     """Test main function with nonexistent files."""
     test_argv = ["sparkgrep", "nonexistent1.py", "nonexistent2.ipynb"]
 
-    with patch("sys.argv", test_argv):
-        result = main()
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
     # Should handle nonexistent files gracefully
     assert result == 0  # No files processed, no issues found
 
 
-def test_main_empty_files():
+def test_main_empty_files(tmp_path, monkeypatch):
     """Test main function with empty files."""
     # Create empty Python file
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write("")  # Empty file
-        empty_py_path = f.name
+    empty_py_path = tmp_path / "snip.py"
+    empty_py_path.touch()
 
     # Create empty notebook file
     empty_notebook = {
@@ -243,45 +197,32 @@ def test_main_empty_files():
         "metadata": {},
         "cells": []
     }
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(empty_notebook, f)
-        empty_nb_path = f.name
+    empty_nb_path = tmp_path / "snip.ipynb"
+    empty_nb_path.write_text(json.dumps(empty_notebook))
 
-    try:
-        test_argv = ["sparkgrep", empty_py_path, empty_nb_path]
-
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = ["sparkgrep", str(empty_py_path), str(empty_nb_path)]
 
-        # Should handle empty files gracefully
-        assert result == 0  # No issues in empty files
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        os.unlink(empty_py_path)
-        os.unlink(empty_nb_path)
+    # Should handle empty files gracefully
+    assert result == 0  # No issues in empty files
 
 @pytest.mark.skip(reason = "Test is failing. Fix later. I should evaluate an Errno 13 PermissionError.")
-def test_main_with_permission_denied():
+def test_main_with_permission_denied(tmp_path, monkeypatch):
     """Test main function when file permissions deny access."""
     python_code = "display(df)"
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        # Remove all permissions
-        os.chmod(temp_path, 0o000)
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-        test_argv = ["sparkgrep", temp_path]
+    # Remove all permissions
+    os.chmod(temp_path, 0o000)
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = ["sparkgrep", str(temp_path)]
 
-        # Should handle permission errors gracefully
-        assert isinstance(result, int)
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        # Restore permissions for cleanup
-        os.chmod(temp_path, 0o644)
-        os.unlink(temp_path)
+    # Should handle permission errors gracefully
+    assert isinstance(result, int)
@@ -1,79 +1,62 @@
-import pytest
-import tempfile
-import os
-from unittest.mock import patch
+import json
+import sys
 
 from sparkgrep.cli import main
 
 
-def test_main_mixed_existent_nonexistent():
+def test_main_mixed_existent_nonexistent(tmp_path, monkeypatch):
     """Test main function with mix of existent and nonexistent files."""
     python_code = "display(df)"
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    try:
-        test_argv = ["sparkgrep", temp_path, "nonexistent.py"]
+    test_argv = ["sparkgrep", str(temp_path), "nonexistent.py"]
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-        assert result == 1  # Should find issues in the existing file
+    assert result == 1  # Should find issues in the existing file
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_main_unsupported_file_types():
+def test_main_unsupported_file_types(tmp_path, monkeypatch):
     """Test main function with unsupported file types."""
     content = "display(df); df.show();"
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        test_argv = ["sparkgrep", temp_path]
+    temp_path = tmp_path / "snip.txt"
+    temp_path.write_text(content)
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = ["sparkgrep", str(temp_path)]
 
-        assert result == 0  # Should succeed (file type not supported)
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        os.unlink(temp_path)
+    assert result == 0  # Should succeed (file type not supported)
 
 
-def test_main_large_number_of_files():
+def test_main_large_number_of_files(tmp_path, monkeypatch):
     """Test main function with many files."""
     files = []
-    try:
-        # Create multiple files, some with issues, some without
-        for i in range(10):
-            if i % 2 == 0:
-                code = f"display(df_{i})  # Issue in file {i}"
-            else:
-                code = f"# Clean file {i}\nprint('No issues here')"
-
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-                f.write(code)
-                files.append(f.name)
+    # Create multiple files, some with issues, some without
+    for i in range(10):
+        if i % 2 == 0:
+            code = f"display(df_{i})  # Issue in file {i}"
+        else:
+            code = f"# Clean file {i}\nprint('No issues here')"
 
-        test_argv = ["sparkgrep"] + files
+        file_path = tmp_path / f"snip_{i}.py"
+        file_path.write_text(code)
+        files.append(str(file_path))
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = ["sparkgrep"] + files
 
-        assert result == 1  # Should find issues in even-numbered files
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        for file_path in files:
-            os.unlink(file_path)
+    assert result == 1  # Should find issues in even-numbered files
 
 
-def test_main_unicode_content():
+def test_main_unicode_content(tmp_path, monkeypatch):
     """Test main function with unicode content."""
     python_code = """
 # -*- coding: utf-8 -*-
@@ -82,23 +65,18 @@ df_世界 = load_data()
 display(df_世界)  # Should be found
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False, encoding="utf-8") as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code, encoding="utf-8")
 
-    try:
-        test_argv = ["sparkgrep", temp_path]
+    test_argv = ["sparkgrep", str(temp_path)]
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-        assert result == 1  # Should find the display call
+    assert result == 1  # Should find the display call
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_main_very_large_single_file():
+def test_main_very_large_single_file(tmp_path, monkeypatch):
     """Test main function with a very large single file."""
     # Create a large file with many lines
     lines = []
@@ -110,63 +88,49 @@ def test_main_very_large_single_file():
 
     large_content = "\n".join(lines)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(large_content)
-        temp_path = f.name
-
-    try:
-        test_argv = ["sparkgrep", temp_path]
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(large_content)
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = ["sparkgrep", str(temp_path)]
 
-        assert result == 1  # Should find the issue even in large file
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        os.unlink(temp_path)
+    assert result == 1  # Should find the issue even in large file
 
 
-def test_main_mixed_file_types():
+def test_main_mixed_file_types(tmp_path, monkeypatch):
     """Test main function with mix of Python and notebook files."""
-    files = []
-    try:
-        # Create Python file with issues
-        python_code = "display(python_df)"
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(python_code)
-            files.append(f.name)
-
-        # Create notebook with issues
-        notebook = {
-            "nbformat": 4,
-            "nbformat_minor": 4,
-            "metadata": {},
-            "cells": [
-                {
-                    "cell_type": "code",
-                    "metadata": {},
-                    "source": ["display(notebook_df)\n"]
-                }
-            ]
-        }
-        import json
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-            json.dump(notebook, f)
-            files.append(f.name)
-
-        test_argv = ["sparkgrep"] + files
-
-        with patch("sys.argv", test_argv):
-            result = main()
-
-        assert result == 1  # Should find issues in both file types
-
-    finally:
-        for file_path in files:
-            os.unlink(file_path)
-
-
-def test_main_deeply_nested_code_structures():
+    # Create Python file with issues
+    python_code = "display(python_df)"
+    py_path = tmp_path / "snip.py"
+    py_path.write_text(python_code)
+
+    # Create notebook with issues
+    notebook = {
+        "nbformat": 4,
+        "nbformat_minor": 4,
+        "metadata": {},
+        "cells": [
+            {
+                "cell_type": "code",
+                "metadata": {},
+                "source": ["display(notebook_df)\n"]
+            }
+        ]
+    }
+    nb_path = tmp_path / "snip.ipynb"
+    nb_path.write_text(json.dumps(notebook))
+
+    test_argv = ["sparkgrep", str(py_path), str(nb_path)]
+
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
+
+    assert result == 1  # Should find issues in both file types
+
+
+def test_main_deeply_nested_code_structures(tmp_path, monkeypatch):
     """Test main function with deeply nested code structures."""
     nested_code = """
 def level1():
@@ -182,23 +146,18 @@ def level1():
     return level2()
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(nested_code)
-        temp_path = f.name
-
-    try:
-        test_argv = ["sparkgrep", temp_path]
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(nested_code)
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = ["sparkgrep", str(temp_path)]
 
-        assert result == 1  # Should find issues in nested code
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        os.unlink(temp_path)
+    assert result == 1  # Should find issues in nested code
 
 
-def test_main_multiline_statements():
+def test_main_multiline_statements(tmp_path, monkeypatch):
     """Test main function with multiline statements."""
     multiline_code = '''
 result = df.select(
@@ -214,23 +173,18 @@ df.show(
 )  # This should also be caught
 '''
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(multiline_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(multiline_code)
 
-    try:
-        test_argv = ["sparkgrep", temp_path]
+    test_argv = ["sparkgrep", str(temp_path)]
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-        assert result == 1  # Should find issues in multiline statements
+    assert result == 1  # Should find issues in multiline statements
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_main_with_string_literals():
+def test_main_with_string_literals(tmp_path, monkeypatch):
     """Test main function ignores patterns in string literals."""
     code_with_strings = '''
 # This should not trigger
@@ -244,46 +198,36 @@ sql_query = """
 actual_display = display(real_df)  # Real function call
 '''
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(code_with_strings)
-        temp_path = f.name
-
-    try:
-        test_argv = ["sparkgrep", temp_path]
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(code_with_strings)
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = ["sparkgrep", str(temp_path)]
 
-        assert result == 1  # Should find only the real function call
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        os.unlink(temp_path)
+    assert result == 1  # Should find only the real function call
 
 
-def test_main_performance_stress_test():
+def test_main_performance_stress_test(tmp_path, monkeypatch):
     """Test main function performance with many patterns and files."""
     files = []
-    try:
-        # Create multiple files with various patterns
-        for i in range(20):
-            if i % 3 == 0:
-                code = f"display(df_{i})\ndf_{i}.show()\ncollect_{i}()"
-            elif i % 3 == 1:
-                code = f"# File {i} with comments only\n# No issues here"
-            else:
-                code = f"def function_{i}():\n    return {i}"
-
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-                f.write(code)
-                files.append(f.name)
-
-        test_argv = ["sparkgrep"] + files
-
-        with patch("sys.argv", test_argv):
-            result = main()
-
-        assert result == 1  # Should find issues in some files
-
-    finally:
-        for file_path in files:
-            os.unlink(file_path)
+    # Create multiple files with various patterns
+    for i in range(20):
+        if i % 3 == 0:
+            code = f"display(df_{i})\ndf_{i}.show()\ncollect_{i}()"
+        elif i % 3 == 1:
+            code = f"# File {i} with comments only\n# No issues here"
+        else:
+            code = f"def function_{i}():\n    return {i}"
+
+        file_path = tmp_path / f"snip_{i}.py"
+        file_path.write_text(code)
+        files.append(str(file_path))
+
+    test_argv = ["sparkgrep"] + files
+
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
+
+    assert result == 1  # Should find issues in some files
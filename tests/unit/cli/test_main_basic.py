@@ -1,13 +1,34 @@
-import pytest
-import tempfile
-import os
 import json
-from unittest.mock import patch
+import sys
 
 from sparkgrep.cli import main
 
 
-def test_main_success_no_issues():
+NOTEBOOK_WITH_ISSUES_JSON = json.dumps({
+    "nbformat": 4,
+    "nbformat_minor": 4,
+    "metadata": {},
+    "cells": [
+        {
+            "cell_type": "code",
+            "metadata": {},
+            "source": [
+                "display(df)  # Issue in notebook\n",
+                "df.show()    # Another issue\n"
+            ]
+        }
+    ]
+})
+
+EMPTY_NOTEBOOK_JSON = json.dumps({
+    "nbformat": 4,
+    "nbformat_minor": 4,
+    "metadata": {},
+    "cells": []
+})
+
+
+def test_main_success_no_issues(fs, monkeypatch):
     """Test main function with files that have no issues."""
     python_code = """
 def clean_function():
@@ -15,24 +36,15 @@ def clean_function():
     result = sum(data)
     return result
 """
+    fs.create_file("/snip.py", contents=python_code)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        test_argv = ["sparkgrep", temp_path]
+    monkeypatch.setattr(sys, "argv", ["sparkgrep", "/snip.py"])
+    result = main()
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    assert result == 0  # Success exit code
 
-        assert result == 0  # Success exit code
 
-    finally:
-        os.unlink(temp_path)
-
-
-def test_main_success_with_issues():
+def test_main_success_with_issues(fs, monkeypatch):
     """Test main function with files that have issues."""
     python_code = """
 def problematic_function():
@@ -41,24 +53,15 @@ def problematic_function():
     df.show()    # Issue: show method
     return df
 """
+    fs.create_file("/snip.py", contents=python_code)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        test_argv = ["sparkgrep", temp_path]
-
-        with patch("sys.argv", test_argv):
-            result = main()
-
-        assert result == 1  # Failure exit code (issues found)
+    monkeypatch.setattr(sys, "argv", ["sparkgrep", "/snip.py"])
+    result = main()
 
-    finally:
-        os.unlink(temp_path)
+    assert result == 1  # Failure exit code (issues found)
 
 
-def test_main_multiple_files():
+def test_main_multiple_files(fs, monkeypatch):
     """Test main function with multiple files."""
     # File with issues
     problematic_code = """
@@ -72,172 +75,101 @@ def clean_function():
     return sum([1, 2, 3])
 """
 
-    files = []
-    try:
-        # Create problematic file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(problematic_code)
-            files.append(f.name)
+    fs.create_file("/problematic.py", contents=problematic_code)
+    fs.create_file("/clean.py", contents=clean_code)
 
-        # Create clean file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(clean_code)
-            files.append(f.name)
+    monkeypatch.setattr(sys, "argv", ["sparkgrep", "/problematic.py", "/clean.py"])
+    result = main()
 
-        test_argv = ["sparkgrep"] + files
+    assert result == 1  # Should return 1 because issues were found
 
-        with patch("sys.argv", test_argv):
-            result = main()
 
-        assert result == 1  # Should return 1 because issues were found
+def test_main_with_notebook(tmp_path, monkeypatch):
+    """Test main function with notebook files."""
+    temp_path = tmp_path / "snip.ipynb"
+    temp_path.write_text(NOTEBOOK_WITH_ISSUES_JSON)
 
-    finally:
-        for file_path in files:
-            os.unlink(file_path)
+    test_argv = ["sparkgrep", str(temp_path)]
 
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-def test_main_with_notebook():
-    """Test main function with notebook files."""
-    notebook = {
-        "nbformat": 4,
-        "nbformat_minor": 4,
-        "metadata": {},
-        "cells": [
-            {
-                "cell_type": "code",
-                "metadata": {},
-                "source": [
-                    "display(df)  # Issue in notebook\n",
-                    "df.show()    # Another issue\n"
-                ]
-            }
-        ]
-    }
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook, f)
-        temp_path = f.name
-
-    try:
-        test_argv = ["sparkgrep", temp_path]
-
-        with patch("sys.argv", test_argv):
-            result = main()
-
-        assert result == 1  # Issues found
-
-    finally:
-        os.unlink(temp_path)
-
-
-def test_main_no_files_provided():
+    assert result == 1  # Issues found
+
+
+def test_main_no_files_provided(monkeypatch):
     """Test main function when no files are provided."""
     test_argv = ["sparkgrep"]
 
-    with patch("sys.argv", test_argv):
-        result = main()
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
     assert result == 0  # Should succeed (no files to process)
 
 
-def test_main_nonexistent_files():
+def test_main_nonexistent_files(monkeypatch):
     """Test main function with nonexistent files."""
     test_argv = ["sparkgrep", "nonexistent1.py", "nonexistent2.ipynb"]
 
-    with patch("sys.argv", test_argv):
-        result = main()
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
     assert result == 0  # Should succeed (no files processed)
 
 
-def test_main_return_values():
+def test_main_return_values(fs, monkeypatch):
     """Test that main function returns correct exit codes."""
-    # Test success case
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write("# Clean file")
-        clean_file = f.name
-
-    # Test failure case
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write("display(df)")
-        problematic_file = f.name
+    fs.create_file("/clean.py", contents="# Clean file")
+    fs.create_file("/problematic.py", contents="display(df)")
 
-    try:
-        # Test clean file
-        with patch("sys.argv", ["sparkgrep", clean_file]):
-            result = main()
-            assert result == 0
+    # Test clean file
+    monkeypatch.setattr(sys, "argv", ["sparkgrep", "/clean.py"])
+    result = main()
+    assert result == 0
 
-        # Test problematic file
-        with patch("sys.argv", ["sparkgrep", problematic_file]):
-            result = main()
-            assert result == 1
+    # Test problematic file
+    monkeypatch.setattr(sys, "argv", ["sparkgrep", "/problematic.py"])
+    result = main()
+    assert result == 1
 
-    finally:
-        os.unlink(clean_file)
-        os.unlink(problematic_file)
 
-
-def test_main_output_format():
+def test_main_output_format(tmp_path, capsys, monkeypatch):
     """Test that main function produces expected output format."""
     python_code = """
 display(df)  # Line 2
 df.show()    # Line 3
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        test_argv = ["sparkgrep", temp_path]
-
-        with patch("sys.argv", test_argv):
-            # Capture stdout to verify output format
-            import io
-            import contextlib
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-            output = io.StringIO()
-            with contextlib.redirect_stdout(output):
-                result = main()
+    test_argv = ["sparkgrep", str(temp_path)]
 
-            output_text = output.getvalue()
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-            # Should contain filename and line information
-            assert temp_path in output_text
-            assert "Line" in output_text
-            assert result == 1
+    # Capture stdout to verify output format
+    output_text = capsys.readouterr().out
 
-    finally:
-        os.unlink(temp_path)
+    # Should contain filename and line information
+    assert str(temp_path) in output_text
+    assert "Line" in output_text
+    assert result == 1
 
 
-def test_main_empty_files():
+def test_main_empty_files(tmp_path, monkeypatch):
     """Test main function with empty files."""
-    files = []
-    try:
-        # Create empty Python file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            files.append(f.name)
-
-        # Create empty notebook
-        empty_notebook = {
-            "nbformat": 4,
-            "nbformat_minor": 4,
-            "metadata": {},
-            "cells": []
-        }
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-            json.dump(empty_notebook, f)
-            files.append(f.name)
+    # Create empty Python file
+    py_path = tmp_path / "snip.py"
+    py_path.touch()
 
-        test_argv = ["sparkgrep"] + files
+    # Create empty notebook
+    nb_path = tmp_path / "snip.ipynb"
+    nb_path.write_text(EMPTY_NOTEBOOK_JSON)
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = ["sparkgrep", str(py_path), str(nb_path)]
 
-        assert result == 0  # Should succeed (no content to analyze)
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        for file_path in files:
-            os.unlink(file_path)
+    assert result == 0  # Should succeed (no content to analyze)
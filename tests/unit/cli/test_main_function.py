@@ -0,0 +1,131 @@
+from unittest.mock import MagicMock
+
+from sparkgrep import cli
+from sparkgrep.cli import main, parse_and_build, run
+from sparkgrep.patterns import build_patterns_list
+
+
+def test_main_no_files(cli_mocks, make_args, capsys):
+    """Test main returns early when no files are given."""
+    cli_mocks.parse.return_value = make_args()
+
+    result = main()
+
+    assert result == 0
+    assert "No files provided" in capsys.readouterr().out
+    cli_mocks.build.assert_not_called()
+    cli_mocks.proc.assert_not_called()
+    cli_mocks.report.assert_not_called()
+
+
+def test_main_no_patterns(cli_mocks, make_args, capsys):
+    """Test main returns early when the pattern list is empty."""
+    cli_mocks.parse.return_value = make_args(files=["file1.py"], disable=True)
+    cli_mocks.build.return_value = []
+
+    result = main()
+
+    assert result == 0
+    assert "No patterns to check" in capsys.readouterr().out
+    cli_mocks.proc.assert_not_called()
+    cli_mocks.report.assert_not_called()
+
+
+def test_main_with_additional_patterns(cli_mocks, make_args):
+    """Test parse_and_build forwards pattern options to build_patterns_list."""
+    cli_mocks.parse.return_value = make_args(
+        files=["file1.py"], additional=["custom:Custom pattern"]
+    )
+    cli_mocks.build.return_value = [("custom", "Custom pattern")]
+
+    files, patterns, jobs = parse_and_build()
+
+    assert files == ["file1.py"]
+    assert patterns == [("custom", "Custom pattern")]
+    assert jobs == 1
+    cli_mocks.build.assert_called_once_with(
+        disable_default_patterns=False,
+        additional_patterns=["custom:Custom pattern"],
+    )
+
+
+def test_main_with_disabled_default_patterns(cli_mocks, make_args):
+    """Test parse_and_build forwards the disable flag to build_patterns_list."""
+    cli_mocks.parse.return_value = make_args(files=["file1.py"], disable=True)
+
+    parse_and_build()
+
+    cli_mocks.build.assert_called_once_with(
+        disable_default_patterns=True,
+        additional_patterns=None,
+    )
+
+
+def test_main_file_processing_order(cli_mocks):
+    """Test run processes and reports files in the order given."""
+    patterns = [("display", "display call")]
+    cli_mocks.proc.return_value = []
+
+    result = run(patterns, ["file1.py", "file2.ipynb"])
+
+    assert result == 0
+    assert [c.args for c in cli_mocks.proc.call_args_list] == [
+        ("file1.py", patterns),
+        ("file2.ipynb", patterns),
+    ]
+    assert [c.args for c in cli_mocks.report.call_args_list] == [
+        ("file1.py", []),
+        ("file2.ipynb", []),
+    ]
+
+
+def test_main_issue_count_summary(cli_mocks, make_args, capsys):
+    """Test main sums issues across files and returns failure."""
+    cli_mocks.parse.return_value = make_args(files=["file1.py", "file2.py"])
+    cli_mocks.build.return_value = [("display", "display call")]
+    cli_mocks.proc.side_effect = [
+        [(1, "display call", "display(df)")],
+        [(2, "display call", "display(a)"), (5, "display call", "display(b)")],
+    ]
+
+    result = main()
+
+    assert result == 1
+    assert "Found 3 useless Spark action(s)" in capsys.readouterr().out
+
+
+def test_run_with_in_memory_sources():
+    """Test run checks in-memory sources without touching the filesystem."""
+    patterns = build_patterns_list()
+    sources = {
+        "clean.py": "result = df.count()\n",
+        "snip.py": "display(df)\n",
+    }
+
+    assert run(patterns, ["clean.py"], sources=sources) == 0
+    assert run(patterns, list(sources), sources=sources) == 1
+
+
+def test_run_with_in_memory_notebook_source():
+    """Test run checks in-memory notebook content."""
+    notebook = (
+        '{"nbformat": 4, "nbformat_minor": 4, "metadata": {}, "cells": '
+        '[{"cell_type": "code", "metadata": {}, "source": ["df.show()\\n"]}]}'
+    )
+
+    result = run(build_patterns_list(), ["nb.ipynb"], sources={"nb.ipynb": notebook})
+
+    assert result == 1
+
+
+def test_run_with_jobs(monkeypatch, capsys):
+    """Test run hands files to process_files when several jobs are requested."""
+    process_files = MagicMock(return_value=[[], [(1, "display call", "display(df)")]])
+    monkeypatch.setattr(cli, "process_files", process_files)
+    patterns = [("display", "display call")]
+
+    result = run(patterns, ["clean.py", "snip.py"], jobs=0)
+
+    assert result == 1
+    process_files.assert_called_once_with(["clean.py", "snip.py"], patterns, None)
+    assert "snip.py:" in capsys.readouterr().out
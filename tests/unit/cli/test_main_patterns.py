@@ -1,92 +1,67 @@
 import pytest
-import tempfile
-import os
-from unittest.mock import patch
+import sys
 
 from sparkgrep.cli import main
 
 
-def test_main_with_additional_patterns():
-    """Test main function with additional patterns."""
-    python_code = """
-custom_function_call(df)
-another_custom_call(data)
-"""
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        # Put file before additional patterns to avoid parsing issues
-        test_argv = [
-            "sparkgrep",
-            temp_path,
-            "--additional-patterns", "custom_function_call:Custom function"
-        ]
-
-        with patch("sys.argv", test_argv):
-            result = main()
-
-        assert result == 1  # Should find the custom pattern
-
-    finally:
-        os.unlink(temp_path)
-
-
-def test_main_disable_default_patterns():
-    """Test main function with disabled default patterns."""
-    python_code = """
-display(df)  # This would normally be caught by default patterns
-df.show()    # This too
-"""
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        test_argv = ["sparkgrep", "--disable-default-patterns", temp_path]
-
-        with patch("sys.argv", test_argv):
-            result = main()
-
-        assert result == 0  # Should succeed (no patterns to check)
-
-    finally:
-        os.unlink(temp_path)
-
-
-def test_main_disable_defaults_with_additional():
-    """Test main function with disabled defaults but additional patterns."""
-    python_code = """
-display(df)  # This won't be caught (defaults disabled)
-custom_call(df)  # This should be caught
-"""
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        test_argv = [
-            "sparkgrep",
-            temp_path,
-            "--disable-default-patterns",
-            "--additional-patterns", "custom_call:Custom pattern"
-        ]
-
-        with patch("sys.argv", test_argv):
-            result = main()
-
-        assert result == 1  # Should find only the custom pattern
-
-    finally:
-        os.unlink(temp_path)
-
-
-@pytest.mark.skip(reason = "Test is failing. Fix later. Pattern is not matching.")
-def test_main_complex_patterns():
+@pytest.fixture
+def display_file(request, fs):
+    """Write the parametrized source to a fake file and return its path."""
+    fs.create_file("/snip.py", contents=request.param)
+    return "/snip.py"
+
+
+@pytest.mark.parametrize(
+    "display_file, argv_suffix, expected",
+    [
+        # Additional patterns are checked on top of the defaults
+        (
+            "custom_function_call(df)\nanother_custom_call(data)\n",
+            ["--additional-patterns", "custom_function_call:Custom function"],
+            1,
+        ),
+        # Disabling defaults leaves no patterns to check
+        (
+            "display(df)\ndf.show()\n",
+            ["--disable-default-patterns"],
+            0,
+        ),
+        # Only the custom pattern is checked when defaults are disabled
+        (
+            "display(df)\ncustom_call(df)\n",
+            ["--disable-default-patterns", "--additional-patterns", "custom_call:Custom pattern"],
+            1,
+        ),
+        # An empty additional patterns list keeps the defaults
+        (
+            "display(df)",
+            ["--additional-patterns"],
+            1,
+        ),
+        # Default patterns are case insensitive
+        (
+            "Display(df)\nDISPLAY(df)\ndisplay(df)\n",
+            [],
+            1,
+        ),
+    ],
+    ids=[
+        "additional_patterns",
+        "disable_default_patterns",
+        "disable_defaults_with_additional",
+        "empty_additional_patterns",
+        "case_sensitivity",
+    ],
+    indirect=["display_file"],
+)
+def test_main_pattern_options(display_file, argv_suffix, expected, monkeypatch):
+    """Test main function exit codes across pattern option combinations."""
+    monkeypatch.setattr(sys, "argv", ["sparkgrep", display_file, *argv_suffix])
+
+    assert main() == expected
+
+
+def test_main_complex_patterns(fs, monkeypatch):
     """Test main function with complex regex patterns."""
     python_code = """
     df.collect()  # Should match
@@ -95,50 +70,38 @@ def test_main_complex_patterns():
     total = df.count()  # Should not match (has assignment)
     """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        test_argv = [
-            "sparkgrep",
-            "--additional-patterns",
-            r"\.collect\(\)(?!\s*[=]):collect without assignment",
-            r"\.count\(\)(?!\s*[=]):count without assignment",
-            temp_path
-        ]
+    fs.create_file("/snip.py", contents=python_code)
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = [
+        "sparkgrep",
+        "--additional-patterns",
+        r"\.collect\(\)(?!\s*[=]):collect without assignment",
+        r"\.count\(\)(?!\s*[=]):count without assignment",
+        "/snip.py"
+    ]
 
-        assert result == 1  # Should find the patterns without assignment
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        os.unlink(temp_path)
+    assert result == 1  # Should find the patterns without assignment
 
 
-def test_main_with_config_file_argument():
+def test_main_with_config_file_argument(fs, monkeypatch):
     """Test main function with config file argument."""
     python_code = "display(df)"
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    fs.create_file("/snip.py", contents=python_code)
 
-    try:
-        test_argv = ["sparkgrep", "--config", "nonexistent_config.json", temp_path]
+    test_argv = ["sparkgrep", "--config", "nonexistent_config.json", "/snip.py"]
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-        # Should still work even with nonexistent config (config not implemented yet)
-        assert result == 1  # Should find the display call
+    # Should still work even with nonexistent config (config not implemented yet)
+    assert result == 1  # Should find the display call
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_main_pattern_precedence():
+def test_main_pattern_precedence(fs, monkeypatch):
     """Test pattern precedence when multiple patterns match."""
     python_code = """
 display(dataframe)
@@ -146,54 +109,23 @@ show_data(df)
 custom_display(table)
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        test_argv = [
-            "sparkgrep",
-            temp_path,
-            "--additional-patterns",
-            "display:General display pattern",
-            "custom_display:Specific custom display"
-        ]
-
-        with patch("sys.argv", test_argv):
-            result = main()
-
-        assert result == 1  # Should find patterns
-
-    finally:
-        os.unlink(temp_path)
-
-
-def test_main_pattern_case_sensitivity():
-    """Test pattern matching case sensitivity."""
-    python_code = """
-Display(df)  # Uppercase
-DISPLAY(df)  # All caps
-display(df)  # Lowercase
-"""
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        # Default patterns should be case insensitive
-        test_argv = ["sparkgrep", temp_path]
+    fs.create_file("/snip.py", contents=python_code)
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = [
+        "sparkgrep",
+        "/snip.py",
+        "--additional-patterns",
+        "display:General display pattern",
+        "custom_display:Specific custom display"
+    ]
 
-        assert result == 1  # Should find display calls regardless of case
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        os.unlink(temp_path)
+    assert result == 1  # Should find patterns
 
 
-def test_main_multiple_additional_patterns():
+def test_main_multiple_additional_patterns(fs, monkeypatch):
     """Test main function with multiple additional patterns."""
     python_code = """
 pattern_one(df)
@@ -202,30 +134,24 @@ pattern_three(table)
 display(result)
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        test_argv = [
-            "sparkgrep",
-            temp_path,
-            "--additional-patterns",
-            "pattern_one:First pattern",
-            "pattern_two:Second pattern",
-            "pattern_three:Third pattern"
-        ]
+    fs.create_file("/snip.py", contents=python_code)
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = [
+        "sparkgrep",
+        "/snip.py",
+        "--additional-patterns",
+        "pattern_one:First pattern",
+        "pattern_two:Second pattern",
+        "pattern_three:Third pattern"
+    ]
 
-        assert result == 1  # Should find multiple patterns
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        os.unlink(temp_path)
+    assert result == 1  # Should find multiple patterns
 
 
-def test_main_pattern_with_special_chars():
+def test_main_pattern_with_special_chars(fs, monkeypatch):
     """Test patterns containing special regex characters."""
     python_code = """
 $variable = "value"
@@ -234,45 +160,18 @@ function.method()
 array[index]
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        test_argv = [
-            "sparkgrep",
-            temp_path,
-            "--additional-patterns",
-            r"\$[a-zA-Z_]+:Variable pattern",
-            r"@[a-zA-Z_]+:Decorator pattern",
-            r"\[[^\]]+\]:Array indexing"
-        ]
-
-        with patch("sys.argv", test_argv):
-            result = main()
-
-        assert result == 1  # Should find special character patterns
-
-    finally:
-        os.unlink(temp_path)
-
-
-def test_main_empty_additional_patterns():
-    """Test main function with empty additional patterns list."""
-    python_code = "display(df)"
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        test_argv = ["sparkgrep", temp_path, "--additional-patterns"]
+    fs.create_file("/snip.py", contents=python_code)
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = [
+        "sparkgrep",
+        "/snip.py",
+        "--additional-patterns",
+        r"\$[a-zA-Z_]+:Variable pattern",
+        r"@[a-zA-Z_]+:Decorator pattern",
+        r"\[[^\]]+\]:Array indexing"
+    ]
 
-        # Should still use default patterns
-        assert result == 1  # Should find display call with default patterns
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        os.unlink(temp_path)
+    assert result == 1  # Should find special character patterns
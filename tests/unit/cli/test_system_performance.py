@@ -1,59 +1,86 @@
 import pytest
-import tempfile
-import os
 import json
-from unittest.mock import patch
+import sys
+from itertools import accumulate
 
 from sparkgrep.cli import main
 
 
-def test_main_memory_handling():
-    """Test main function memory handling with large patterns and files."""
-    # Create file with many lines
-    lines = [f"line_{i} = {i}" for i in range(10000)]
-    lines[5000] = "display(df)  # Hidden in the middle"
-    large_content = "\n".join(lines)
+# Built once at import so reruns of the tests below skip the string building
+_LARGE_CONTENT = "".join(
+    "display(df)  # Hidden in the middle\n" if i == 5000 else f"line_{i} = {i}\n"
+    for i in range(10000)
+)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(large_content)
-        temp_path = f.name
+_INDENTS = list(accumulate(["  "] * 100, initial=""))
 
-    try:
-        test_argv = ["sparkgrep", temp_path]
+_NESTED_CONTENT = "\n".join(
+    f"{_INDENTS[level]}display(nested_df)  # Deep nesting"
+    if level == 50
+    else f"{_INDENTS[level]}# Level {level}"
+    for level in range(100)
+)
 
-        with patch("sys.argv", test_argv):
-            result = main()
+_FUNCTION_CALLS = """
+function_1(df)
+function_25(data)
+function_50(table)
+"""
 
-        assert result == 1  # Should find the hidden display call
 
-    finally:
-        os.unlink(temp_path)
+@pytest.fixture(scope="module")
+def tmp_workspace(tmp_path_factory):
+    """Shared directory for the many-file tests, cleaned up once by pytest."""
+    return tmp_path_factory.mktemp("sg")
 
 
-def test_main_concurrent_file_access():
-    """Test main function with multiple files accessed simultaneously."""
-    files = []
-    try:
-        # Create multiple files quickly
-        for i in range(20):
-            content = f"display(df_{i})" if i % 3 == 0 else f"# File {i}"
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-                f.write(content)
-                files.append(f.name)
+@pytest.fixture
+def write_source(tmp_path):
+    """Factory writing content into tmp_path and returning the path as str."""
+
+    def _write(content, suffix=".py"):
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        path = tmp_path / f"snip{suffix}"
+        path.write_bytes(content)
+        return str(path)
+
+    return _write
+
+
+def test_main_memory_handling(write_source, monkeypatch):
+    """Test main function memory handling with large patterns and files."""
+    # Create file with many lines
+    temp_path = write_source(_LARGE_CONTENT)
+
+    test_argv = ["sparkgrep", temp_path]
+
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
+
+    assert result == 1  # Should find the hidden display call
 
-        test_argv = ["sparkgrep"] + files
 
-        with patch("sys.argv", test_argv):
-            result = main()
+def test_main_concurrent_file_access(tmp_workspace, monkeypatch):
+    """Test main function with multiple files accessed simultaneously."""
+    # Create multiple files quickly
+    contents = [
+        (f"display(df_{i})" if i % 3 == 0 else f"# File {i}").encode()
+        for i in range(20)
+    ]
+    paths = [tmp_workspace / f"concurrent_{i}.py" for i in range(20)]
+    for path, content in zip(paths, contents):
+        path.write_bytes(content)
+
+    test_argv = ["sparkgrep"] + [str(p) for p in paths]
 
-        assert result == 1  # Should find issues in some files
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        for file_path in files:
-            os.unlink(file_path)
+    assert result == 1  # Should find issues in some files
 
 
-def test_main_notebook_without_metadata():
+def test_main_notebook_without_metadata(write_source, monkeypatch):
     """Test main function with notebook missing metadata."""
     notebook = {
         "nbformat": 4,
@@ -68,147 +95,76 @@ def test_main_notebook_without_metadata():
         ]
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook, f)
-        temp_path = f.name
+    temp_path = write_source(json.dumps(notebook), suffix=".ipynb")
 
-    try:
-        test_argv = ["sparkgrep", temp_path]
+    test_argv = ["sparkgrep", temp_path]
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-        # Should handle malformed notebooks gracefully
-        assert isinstance(result, int)
+    # Should handle malformed notebooks gracefully
+    assert isinstance(result, int)
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_main_interrupt_simulation():
+def test_main_interrupt_simulation(display_py_file, monkeypatch):
     """Test main function behavior under simulated interruption conditions."""
-    python_code = "display(df)"
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        test_argv = ["sparkgrep", temp_path]
-
-        with patch("sys.argv", test_argv):
-            result = main()
-
-        # Should complete normally in this test
-        assert result == 1
-
-    finally:
-        os.unlink(temp_path)
-
-
-def test_main_with_many_files_performance():
-    """Test main function performance with many files."""
-    files = []
-    try:
-        # Create many files
-        for i in range(50):
-            content = f"display(df_{i})" if i % 5 == 0 else f"# File {i} content"
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-                f.write(content)
-                files.append(f.name)
-
-        test_argv = ["sparkgrep"] + files
-
-        with patch("sys.argv", test_argv):
-            result = main()
-
-        assert result == 1  # Should find issues in some files
-
-    finally:
-        for file_path in files:
-            os.unlink(file_path)
-
-
-def test_main_with_large_notebook():
-    """Test main function with very large notebook files."""
-    # Create notebook with many cells
-    cells = []
-    for i in range(1000):
-        if i % 100 == 0:
-            cells.append({
-                "cell_type": "code",
-                "metadata": {},
-                "source": [f"display(df_{i})  # Cell {i}\n"]
-            })
+    test_argv = ["sparkgrep", str(display_py_file)]
+
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
+
+    # Should complete normally in this test
+    assert result == 1
+
+
+@pytest.mark.parametrize(
+    "npatterns,nfiles",
+    [(100, 1), (200, 1), (0, 50)],
+    ids=["many_additional_patterns", "stress_patterns", "many_files"],
+)
+def test_main_scaling(tmp_workspace, monkeypatch, npatterns, nfiles):
+    """Test main function with many additional patterns or many files."""
+    prefix = f"scale_{npatterns}_{nfiles}"
+    paths = [tmp_workspace / f"{prefix}_{i}.py" for i in range(nfiles)]
+    for i, path in enumerate(paths):
+        if nfiles == 1:
+            path.write_text(_FUNCTION_CALLS)
         else:
-            cells.append({
-                "cell_type": "code",
-                "metadata": {},
-                "source": [f"# Cell {i} - no issues\n"]
-            })
-
-    large_notebook = {
-        "nbformat": 4,
-        "nbformat_minor": 4,
-        "metadata": {},
-        "cells": cells
-    }
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(large_notebook, f)
-        temp_path = f.name
-
-    try:
-        test_argv = ["sparkgrep", temp_path]
-
-        with patch("sys.argv", test_argv):
-            result = main()
+            path.write_text(f"display(df_{i})" if i % 5 == 0 else f"# File {i} content")
 
-        assert result == 1  # Should find issues in some cells
+    patterns = [f"function_{i}:Function {i}" for i in range(npatterns)]
+    test_argv = ["sparkgrep"]
+    if patterns:
+        test_argv += ["--additional-patterns"] + patterns
+    test_argv += [str(p) for p in paths]
+    monkeypatch.setattr(sys, "argv", test_argv)
 
-    finally:
-        os.unlink(temp_path)
+    assert main() == 1
 
-@pytest.mark.skip(reason = "Test is failing. Fix later. Pattern is not matching.")
-def test_main_stress_test_patterns():
-    """Test main function with stress test using many patterns."""
-    python_code = """
-    function_1(df)
-    function_2(data)
-    function_3(table)
-    display(result)
-    show(output)
-    """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        # Create many patterns to stress test pattern matching
-        patterns = []
-        for i in range(200):
-            patterns.append(f"function_{i}:Function {i}")
-
-        # Add some that will actually match
-        patterns.extend([
-            "function_1:Function 1 match",
-            "display:Display match",
-            "show:Show match"
-        ])
+@pytest.mark.slow
+def test_main_with_large_notebook(write_source, monkeypatch):
+    """Test main function with very large notebook files."""
+    # Create notebook with many cells, written straight from a JSON template
+    cells = ",".join(
+        f'{{"cell_type": "code", "metadata": {{}}, "source": ["display(df_{i})  # Cell {i}\\n"]}}'
+        if i % 100 == 0
+        else f'{{"cell_type": "code", "metadata": {{}}, "source": ["# Cell {i} - no issues\\n"]}}'
+        for i in range(1000)
+    )
 
-        test_argv = ["sparkgrep", "--additional-patterns"] + patterns + [temp_path]
+    header = '{"nbformat": 4, "nbformat_minor": 4, "metadata": {}, "cells": ['
+    temp_path = write_source(header + cells + "]}", suffix=".ipynb")
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = ["sparkgrep", temp_path]
 
-        assert result == 1  # Should find some matches
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        os.unlink(temp_path)
+    assert result == 1  # Should find issues in some cells
 
 
-def test_main_unicode_content_performance():
+def test_main_unicode_content_performance(write_source, monkeypatch):
     """Test main function with unicode-heavy content."""
     unicode_code = """
 # Unicode content test
@@ -220,90 +176,48 @@ display(unicode_dataframe)  # This should match
 データ表示(df)  # Japanese function call
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False, encoding="utf-8") as f:
-        f.write(unicode_code)
-        temp_path = f.name
+    temp_path = write_source(unicode_code.encode("utf-8"))
 
-    try:
-        test_argv = ["sparkgrep", temp_path]
+    test_argv = ["sparkgrep", temp_path]
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-        assert result == 1  # Should find the display call
+    assert result == 1  # Should find the display call
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_main_nested_patterns_performance():
+def test_main_nested_patterns_performance(write_source, monkeypatch):
     """Test performance with deeply nested pattern matches."""
-    # Create code with nested structures
-    nested_code = []
-    for level in range(100):
-        indent = "  " * level
-        if level == 50:
-            nested_code.append(f"{indent}display(nested_df)  # Deep nesting")
-        else:
-            nested_code.append(f"{indent}# Level {level}")
-
-    complex_content = "\n".join(nested_code)
+    temp_path = write_source(_NESTED_CONTENT)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(complex_content)
-        temp_path = f.name
+    test_argv = ["sparkgrep", temp_path]
 
-    try:
-        test_argv = ["sparkgrep", temp_path]
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    assert result == 1  # Should find the deeply nested display call
 
-        assert result == 1  # Should find the deeply nested display call
 
-    finally:
-        os.unlink(temp_path)
-
-
-def test_main_boundary_conditions():
+def test_main_boundary_conditions(write_source, monkeypatch):
     """Test main function with boundary conditions."""
     # Test with minimal content
     minimal_code = "d"  # Single character
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(minimal_code)
-        temp_path = f.name
-
-    try:
-        test_argv = ["sparkgrep", temp_path]
+    temp_path = write_source(minimal_code)
 
-        with patch("sys.argv", test_argv):
-            result = main()
+    test_argv = ["sparkgrep", temp_path]
 
-        # Should handle minimal content gracefully
-        assert result == 0  # No matches in minimal content
+    monkeypatch.setattr(sys, "argv", test_argv)
+    result = main()
 
-    finally:
-        os.unlink(temp_path)
+    # Should handle minimal content gracefully
+    assert result == 0  # No matches in minimal content
 
 
-def test_main_resource_cleanup():
+def test_main_resource_cleanup(monkeypatch, display_py_file):
     """Test that main function properly cleans up resources."""
-    python_code = "display(df)"
-
-    # Create temporary file
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        test_argv = ["sparkgrep", temp_path]
-
-        # Run multiple times to test resource cleanup
-        for _ in range(10):
-            with patch("sys.argv", test_argv):
-                result = main()
-                assert result == 1
+    monkeypatch.setattr(sys, "argv", ["sparkgrep", str(display_py_file)])
 
-    finally:
-        os.unlink(temp_path)
+    # Run multiple times to test resource cleanup
+    for _ in range(10):
+        assert main() == 1
@@ -0,0 +1,83 @@
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+
+import pytest
+
+
+# Compiled once at import; check_line_for_patterns uses re.Pattern objects as is
+_DISPLAY = (re.compile(r"display\(", re.IGNORECASE), "display function")
+_SHOW = (re.compile(r"\.show\(", re.IGNORECASE), "show method")
+_COLLECT = (re.compile(r"\.collect\(", re.IGNORECASE), "collect method")
+
+# Checked-in notebooks, linked into tmp_path instead of re-encoded per test
+FIXTURES_DIR = Path(__file__).parents[2] / "fixtures"
+
+# Constant notebook keys, shared by every notebook built by make_notebook
+_NB_SHELL = {"nbformat": 4, "nbformat_minor": 4, "metadata": {}}
+
+
+@pytest.fixture(scope="session")
+def display_pattern():
+    """Precompiled display() pattern shared by the whole session."""
+    return [_DISPLAY]
+
+
+@pytest.fixture(scope="session")
+def show_patterns():
+    """Precompiled display() and .show() patterns."""
+    return [_DISPLAY, _SHOW]
+
+
+@pytest.fixture(scope="session")
+def collect_patterns():
+    """Precompiled display(), .show() and .collect() patterns."""
+    return [_DISPLAY, _SHOW, _COLLECT]
+
+
+@pytest.fixture(scope="session")
+def make_notebook():
+    """Build an nbformat 4 notebook dict around a list of cells."""
+
+    def _make(cells):
+        return {**_NB_SHELL, "cells": cells}
+
+    return _make
+
+
+@pytest.fixture
+def link_notebook(tmp_path):
+    """Factory placing a notebook from tests/fixtures into tmp_path.
+
+    The file is hard-linked when possible, so tests must not modify it.
+    """
+
+    def _link(name, dst_name=None):
+        src = FIXTURES_DIR / name
+        dst = tmp_path / (dst_name or name)
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+        return dst
+
+    return _link
+
+
+@pytest.fixture
+def write_notebook(tmp_path):
+    """Factory writing a notebook dict into tmp_path as UTF-8 JSON.
+
+    The file is written in a single call and its path is returned, so tests
+    need neither a temp file handle nor cleanup.
+    """
+
+    def _write(notebook, name="snip.ipynb"):
+        data = json.dumps(notebook, ensure_ascii=False).encode("utf-8")
+        path = tmp_path / name
+        path.write_bytes(data)
+        return path
+
+    return _write
@@ -1,257 +1,193 @@
 import pytest
-import tempfile
-import os
 import json
+from collections import Counter
 from pathlib import Path
 
-from sparkgrep.file_processors import process_single_file
+from sparkgrep.file_processors import (
+    process_files,
+    process_single_file,
+    process_source,
+)
+from sparkgrep.utils import compile_union
 
 
-def test_process_python_file():
-    """Test processing a Python file."""
-    python_code = """
+PYTHON_CODE = """
 def example():
     display(df)  # Should be found
     df.show()    # Should be found
     return df
 """
 
-    patterns = [
-        (r"display\(", "display function"),
-        (r"\.show\(", "show method")
+NOTEBOOK_JSON = json.dumps({
+    "nbformat": 4,
+    "nbformat_minor": 4,
+    "metadata": {},
+    "cells": [
+        {
+            "cell_type": "code",
+            "metadata": {},
+            "source": [
+                "# Data processing\n",
+                "display(df)  # Should be found\n",
+                "df.show()    # Should be found\n"
+            ]
+        }
     ]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        issues = process_single_file(Path(temp_path), patterns)
-
-        assert len(issues) == 2
-        descriptions = [issue[1] for issue in issues]
-        assert "display function" in descriptions
-        assert "show method" in descriptions
-
-    finally:
-        os.unlink(temp_path)
-
-
-def test_process_notebook_file():
-    """Test processing a Jupyter notebook file."""
-    notebook = {
-        "nbformat": 4,
-        "nbformat_minor": 4,
-        "metadata": {},
-        "cells": [
-            {
-                "cell_type": "code",
-                "metadata": {},
-                "source": [
-                    "# Data processing\n",
-                    "display(df)  # Should be found\n",
-                    "df.show()    # Should be found\n"
-                ]
-            }
-        ]
-    }
-
-    patterns = [
-        (r"display\(", "display function"),
-        (r"\.show\(", "show method")
-    ]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook, f)
-        temp_path = f.name
-
-    try:
-        issues = process_single_file(Path(temp_path), patterns)
-
-        assert len(issues) == 2
-        descriptions = [issue[1] for issue in issues]
+})
+
+
+@pytest.mark.parametrize(
+    "suffix,content,expected",
+    [
+        (".py", PYTHON_CODE, 2),
+        (".ipynb", NOTEBOOK_JSON, 2),
+        # Unsupported file types are not checked
+        (".txt", "display(df); df.show();", 0),
+    ],
+    ids=["python", "notebook", "unsupported"],
+)
+def test_process_file_by_type(tmp_path, show_patterns, suffix, content, expected):
+    """Test processing Python, notebook and unsupported files."""
+    temp_path = tmp_path / f"snip{suffix}"
+    temp_path.write_text(content)
+
+    issues = process_single_file(temp_path, show_patterns)
+
+    assert len(issues) == expected
+    descriptions = [issue[1] for issue in issues]
+    if expected:
         assert "display function" in descriptions
         assert "show method" in descriptions
 
-    finally:
-        os.unlink(temp_path)
-
-
-def test_process_unsupported_file_type():
-    """Test processing an unsupported file type."""
-    content = "display(df); df.show();"
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        issues = process_single_file(Path(temp_path), patterns)
-        # Should return empty list for unsupported file types
-        assert len(issues) == 0
-
-    finally:
-        os.unlink(temp_path)
 
-
-def test_process_nonexistent_file():
+def test_process_nonexistent_file(display_pattern):
     """Test processing a nonexistent file."""
-    patterns = [(r"display\(", "display function")]
 
-    issues = process_single_file(Path("nonexistent_file.py"), patterns)
+    issues = process_single_file(Path("nonexistent_file.py"), display_pattern)
     assert len(issues) == 0
 
 
-def test_process_file_empty_patterns():
-    """Test processing files with empty patterns list."""
-    python_code = "display(df); df.show();"
-    patterns = []
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        issues = process_single_file(Path(temp_path), patterns)
-        assert len(issues) == 0
-
-    finally:
-        os.unlink(temp_path)
-
-
-def test_process_file_pathlib_path():
-    """Test that function works with pathlib.Path objects."""
-    python_code = "display(df)"
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        # Test with Path object
-        path_obj = Path(temp_path)
-        issues = process_single_file(path_obj, patterns)
-
-        assert len(issues) == 1
-        assert issues[0][1] == "display function"
-
-    finally:
-        os.unlink(temp_path)
-
-
-def test_process_file_return_format():
-    """Test that the return format is correct."""
-    python_code = """
-# Line 1
-display(df)  # Line 2 - should be found
-"""
-
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        issues = process_single_file(Path(temp_path), patterns)
-
-        assert len(issues) == 1
-        issue = issues[0]
-
-        # Check that issue is a tuple with (line_info, description, content)
-        assert len(issue) == 3
-
-        line_info, description, content = issue
-        assert description == "display function"
-        assert "display(df)" in content
-        assert isinstance(line_info, (str, int))  # Line info format may vary
-
-    finally:
-        os.unlink(temp_path)
-
-
-def test_process_file_multiple_issues_same_file():
-    """Test processing a file with multiple different issues."""
-    python_code = """
+@pytest.mark.parametrize(
+    "python_code,patterns,expected",
+    [
+        ("display(df); df.show();", [], []),
+        (
+            "\n# Line 1\ndisplay(df)  # Line 2 - should be found\n",
+            "display_pattern",
+            ["display function"],
+        ),
+        (
+            """
 def process_data():
     display(df1)      # Issue 1
     df2.show()        # Issue 2
     df3.collect()     # Issue 3
     display(df4)      # Issue 4
-"""
+""",
+            "collect_patterns",
+            ["display function", "show method", "collect method", "display function"],
+        ),
+        (
+            "\nsimple_call()\nanother_function()\ndisplay(data)\n",
+            [
+                (r"simple_call", "simple call"),
+                (r"another_function", "another function"),
+                (r"display", "display call")
+            ],
+            ["simple call", "another function", "display call"],
+        ),
+    ],
+    ids=["empty-patterns", "return-format", "multi-issue", "simple-patterns"],
+)
+def test_process_python_source(request, python_code, patterns, expected):
+    """Test the issues reported for Python content with various patterns."""
+    if isinstance(patterns, str):
+        patterns = request.getfixturevalue(patterns)
+
+    issues = process_source("snip.py", python_code, patterns)
+
+    # Each issue is a (line_number, description, content) tuple
+    assert all(len(issue) == 3 for issue in issues)
+    assert all(isinstance(issue[0], int) for issue in issues)
+    assert Counter(issue[1] for issue in issues) == Counter(expected)
+
+
+@pytest.mark.parametrize("path_type", [Path, str], ids=["pathlib", "string"])
+def test_process_file_path_types(display_py_file, display_pattern, path_type):
+    """Test that function works with pathlib.Path objects and string paths."""
+    issues = process_single_file(path_type(display_py_file), display_pattern)
+
+    assert len(issues) == 1
+    assert issues[0][1] == "display function"
+
+
+def test_process_source_dispatches_on_suffix(display_pattern):
+    """Test in-memory processing picks the checker from the file name."""
+    notebook = json.dumps({
+        "nbformat": 4,
+        "nbformat_minor": 4,
+        "metadata": {},
+        "cells": [{"cell_type": "code", "metadata": {}, "source": ["display(df)\n"]}]
+    })
 
-    patterns = [
-        (r"display\(", "display function"),
-        (r"\.show\(", "show method"),
-        (r"\.collect\(", "collect method")
+    assert process_source("snip.py", "x = 1\ndisplay(df)\n", display_pattern) == [
+        (2, "display function", "display(df)")
     ]
+    assert process_source("nb.ipynb", notebook, display_pattern) == [
+        ("Cell 1, Line 1", "display function", "display(df)")
+    ]
+    assert process_source("notes.txt", "display(df)", display_pattern) == []
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        issues = process_single_file(Path(temp_path), patterns)
-
-        assert len(issues) == 4
 
-        descriptions = [issue[1] for issue in issues]
-        assert descriptions.count("display function") == 2
-        assert descriptions.count("show method") == 1
-        assert descriptions.count("collect method") == 1
+def test_process_source_invalid_notebook(display_pattern):
+    """Test in-memory processing of malformed notebook content."""
 
-    finally:
-        os.unlink(temp_path)
+    assert process_source("nb.ipynb", "{ invalid", display_pattern) == []
 
 
-def test_process_file_simple_patterns():
-    """Test with simple, straightforward patterns."""
-    python_code = """
-simple_call()
-another_function()
-display(data)
-"""
+def test_process_file_precompiled_patterns_share_union(tmp_path, collect_patterns):
+    """Test that precompiled fixture patterns are pre-screened in one scan."""
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text("x = 1\ny = 2\ndf.collect()\n")
 
-    patterns = [
-        (r"simple_call", "simple call"),
-        (r"another_function", "another function"),
-        (r"display", "display call")
-    ]
+    issues = process_single_file(temp_path, collect_patterns)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    assert issues == [(3, "collect method", "df.collect()")]
+    assert compile_union(tuple(p for p, _ in collect_patterns)) is not None
 
-    try:
-        issues = process_single_file(Path(temp_path), patterns)
 
-        assert len(issues) == 3
-        descriptions = [issue[1] for issue in issues]
-        assert "simple call" in descriptions
-        assert "another function" in descriptions
-        assert "display call" in descriptions
+@pytest.mark.parametrize("jobs", [1, 2], ids=["serial", "pool"])
+def test_process_files_keeps_order(tmp_path, show_patterns, jobs):
+    """Test that results follow the order of the files given."""
+    paths = []
+    for i, content in enumerate(["display(df)\n", "x = 1\n", "df.show()\n"] * 3):
+        path = tmp_path / f"snip_{i}.py"
+        path.write_text(content)
+        paths.append(str(path))
 
-    finally:
-        os.unlink(temp_path)
+    results = process_files(paths, show_patterns, jobs)
 
+    assert [[issue[1] for issue in issues] for issues in results] == [
+        ["display function"],
+        [],
+        ["show method"],
+    ] * 3
 
-def test_process_file_with_string_filename():
-    """Test that function works with string file paths."""
-    python_code = "display(df)"
-    patterns = [(r"display\(", "display function")]
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+@pytest.mark.parametrize("suffix", [".py", ".ipynb"])
+def test_process_file_empty_patterns_skips_read(tmp_path, capsys, suffix):
+    """Test that files are not read when there are no patterns."""
+    temp_path = tmp_path / f"snip{suffix}"
+    # Unreadable content would print a warning if the file were read
+    temp_path.write_bytes(b"\xff\xfe display(df)")
 
-    try:
-        # Test with string path (should work with Path conversion)
-        issues = process_single_file(Path(temp_path), patterns)
+    assert process_single_file(temp_path, []) == []
+    assert capsys.readouterr().out == ""
 
-        assert len(issues) == 1
-        assert issues[0][1] == "display function"
 
-    finally:
-        os.unlink(temp_path)
+@pytest.mark.parametrize("suffix", [".py", ".ipynb"])
+def test_process_source_empty_patterns_skips_parse(capsys, suffix):
+    """Test that in-memory sources are not parsed when there are no patterns."""
+    # Invalid notebook JSON would print a warning if it were parsed
+    assert process_source(f"snip{suffix}", "{display(df)", []) == []
+    assert capsys.readouterr().out == ""
@@ -1,24 +1,12 @@
-import pytest
-import tempfile
-import os
-import json
 from pathlib import Path
+from types import SimpleNamespace
 
-from sparkgrep.file_processors import check_notebook_file
+from sparkgrep.file_processors import _process_notebook_cell, check_notebook_file
 
 
-def create_test_notebook(cells):
-    """Helper function to create a test notebook with given cells."""
-    notebook = {
-        "nbformat": 4,
-        "nbformat_minor": 4,
-        "metadata": {},
-        "cells": cells
-    }
-    return notebook
-
-
-def test_check_notebook_file_with_matches():
+def test_check_notebook_file_with_matches(
+    make_notebook, write_notebook, show_patterns
+):
     """Test checking a notebook that contains pattern matches."""
     cells = [
         {
@@ -27,230 +15,113 @@ def test_check_notebook_file_with_matches():
             "source": [
                 "# Load data\n",
                 "df = spark.read.parquet('data.parquet')\n",
-                "display(df)  # This should match\n"
-            ]
+                "display(df)  # This should match\n",
+            ],
         },
         {
             "cell_type": "code",
             "metadata": {},
             "source": [
                 "# Process data\n",
-                "df.show()  # This should also match\n"
-            ]
-        }
-    ]
-
-    notebook = create_test_notebook(cells)
-    patterns = [
-        (r"display\(", "display function"),
-        (r"\.show\(", "show method")
+                "df.show()  # This should also match\n",
+            ],
+        },
     ]
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook, f)
-        temp_path = f.name
+    temp_path = write_notebook(make_notebook(cells))
 
-    try:
-        issues = check_notebook_file(Path(temp_path), patterns)
+    issues = check_notebook_file(temp_path, show_patterns)
 
-        assert len(issues) == 2
+    assert len(issues) == 2
 
-        descriptions = [issue[1] for issue in issues]
-        assert "display function" in descriptions
-        assert "show method" in descriptions
+    descriptions = [issue[1] for issue in issues]
+    assert "display function" in descriptions
+    assert "show method" in descriptions
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_check_notebook_file_no_matches():
+def test_check_notebook_file_no_matches(link_notebook, show_patterns):
     """Test checking a notebook with no pattern matches."""
-    cells = [
-        {
-            "cell_type": "code",
-            "metadata": {},
-            "source": [
-                "import pandas as pd\n",
-                "data = [1, 2, 3, 4, 5]\n",
-                "print(f'Data: {data}')\n"
-            ]
-        },
-        {
-            "cell_type": "code",
-            "metadata": {},
-            "source": [
-                "result = sum(data)\n",
-                "print(f'Sum: {result}')\n"
-            ]
-        }
-    ]
-
-    notebook = create_test_notebook(cells)
-    patterns = [
-        (r"display\(", "display function"),
-        (r"\.show\(", "show method")
-    ]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook, f)
-        temp_path = f.name
+    temp_path = link_notebook("noop.ipynb")
 
-    try:
-        issues = check_notebook_file(Path(temp_path), patterns)
-        assert len(issues) == 0
-
-    finally:
-        os.unlink(temp_path)
+    issues = check_notebook_file(temp_path, show_patterns)
+    assert len(issues) == 0
 
 
-def test_check_notebook_file_multiple_code_cells():
+def test_check_notebook_file_multiple_code_cells(link_notebook, collect_patterns):
     """Test checking notebook with multiple code cells."""
-    cells = [
-        {
-            "cell_type": "code",
-            "metadata": {},
-            "source": [
-                "# Cell 1\n",
-                "df1 = load_data()\n",
-                "display(df1)\n"
-            ]
-        },
-        {
-            "cell_type": "code",
-            "metadata": {},
-            "source": [
-                "# Cell 2\n",
-                "df2 = transform_data(df1)\n",
-                "df2.show()\n"
-            ]
-        },
-        {
-            "cell_type": "code",
-            "metadata": {},
-            "source": [
-                "# Cell 3\n",
-                "final_result = df2.collect()\n",
-                "print('Done')\n"
-            ]
-        }
-    ]
+    temp_path = link_notebook("multi.ipynb")
 
-    notebook = create_test_notebook(cells)
-    patterns = [
-        (r"display\(", "display function"),
-        (r"\.show\(", "show method"),
-        (r"\.collect\(", "collect method")
-    ]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook, f)
-        temp_path = f.name
-
-    try:
-        issues = check_notebook_file(Path(temp_path), patterns)
+    issues = check_notebook_file(temp_path, collect_patterns)
 
-        assert len(issues) == 3
+    assert len(issues) == 3
 
-        descriptions = [issue[1] for issue in issues]
-        assert "display function" in descriptions
-        assert "show method" in descriptions
-        assert "collect method" in descriptions
+    descriptions = [issue[1] for issue in issues]
+    assert "display function" in descriptions
+    assert "show method" in descriptions
+    assert "collect method" in descriptions
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_check_notebook_file_empty_notebook():
+def test_check_notebook_file_empty_notebook(
+    make_notebook, write_notebook, display_pattern
+):
     """Test checking an empty notebook."""
-    cells = []
-
-    notebook = create_test_notebook(cells)
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook, f)
-        temp_path = f.name
-
-    try:
-        issues = check_notebook_file(Path(temp_path), patterns)
-        assert len(issues) == 0
+    temp_path = write_notebook(make_notebook([]))
 
-    finally:
-        os.unlink(temp_path)
+    issues = check_notebook_file(temp_path, display_pattern)
+    assert len(issues) == 0
 
 
-def test_check_notebook_file_nonexistent():
+def test_check_notebook_file_nonexistent(display_pattern):
     """Test handling of nonexistent notebook files."""
-    patterns = [(r"display\(", "display function")]
 
-    issues = check_notebook_file(Path("nonexistent_notebook.ipynb"), patterns)
+    issues = check_notebook_file(Path("nonexistent_notebook.ipynb"), display_pattern)
     assert len(issues) == 0
 
 
-def test_check_notebook_file_empty_patterns():
+def test_check_notebook_file_empty_patterns(make_notebook, write_notebook):
     """Test checking notebook with empty patterns list."""
     cells = [
         {
             "cell_type": "code",
             "metadata": {},
-            "source": [
-                "display(df)\n",
-                "df.show()\n"
-            ]
-        }
+            "source": ["display(df)\n", "df.show()\n"],
+        },
     ]
-
-    notebook = create_test_notebook(cells)
     patterns = []  # Empty patterns list
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook, f)
-        temp_path = f.name
+    temp_path = write_notebook(make_notebook(cells))
 
-    try:
-        issues = check_notebook_file(Path(temp_path), patterns)
-        assert len(issues) == 0  # No patterns to match
+    issues = check_notebook_file(temp_path, patterns)
+    assert len(issues) == 0  # No patterns to match
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_check_notebook_file_simple_patterns():
+def test_check_notebook_file_simple_patterns(make_notebook, write_notebook):
     """Test notebook checking with simple regex patterns."""
     cells = [
         {
             "cell_type": "code",
             "metadata": {},
-            "source": [
-                "simple_function()\n",
-                "another_call()\n"
-            ]
-        }
+            "source": ["simple_function()\n", "another_call()\n"],
+        },
     ]
-
-    notebook = create_test_notebook(cells)
     patterns = [
         (r"simple_function", "simple function call"),
         (r"another_call", "another function call")
     ]
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook, f)
-        temp_path = f.name
+    temp_path = write_notebook(make_notebook(cells))
 
-    try:
-        issues = check_notebook_file(Path(temp_path), patterns)
+    issues = check_notebook_file(temp_path, patterns)
 
-        assert len(issues) == 2
-        descriptions = [issue[1] for issue in issues]
-        assert "simple function call" in descriptions
-        assert "another function call" in descriptions
+    assert len(issues) == 2
+    descriptions = [issue[1] for issue in issues]
+    assert "simple function call" in descriptions
+    assert "another function call" in descriptions
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_check_notebook_file_line_numbers():
+def test_check_notebook_file_line_numbers(
+    make_notebook, write_notebook, display_pattern
+):
     """Test that line numbers are reported correctly."""
     cells = [
         {
@@ -259,25 +130,34 @@ def test_check_notebook_file_line_numbers():
             "source": [
                 "# First line\n",
                 "display(df)  # Second line\n",
-                "# Third line\n"
-            ]
-        }
+                "# Third line\n",
+            ],
+        },
     ]
 
-    notebook = create_test_notebook(cells)
-    patterns = [(r"display\(", "display function")]
+    temp_path = write_notebook(make_notebook(cells))
+
+    issues = check_notebook_file(temp_path, display_pattern)
+
+    assert len(issues) == 1
+    # Check that line number is correctly reported
+    line_info = issues[0][0]
+    assert "2" in str(line_info)  # Should be line 2
+
+
+def test_process_code_cell_with_matches(display_pattern):
+    """Test that a code cell reports matches with its cell and line number."""
+    # Only cell_type and source are read, so a plain namespace stands in for
+    # an nbformat cell
+    cell = SimpleNamespace(cell_type="code", source="x = 1\ndisplay(df)")
+
+    issues = _process_notebook_cell(cell, 2, display_pattern)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook, f)
-        temp_path = f.name
+    assert issues == [("Cell 3, Line 2", "display function", "display(df)")]
 
-    try:
-        issues = check_notebook_file(Path(temp_path), patterns)
 
-        assert len(issues) == 1
-        # Check that line number is correctly reported
-        line_info = issues[0][0]
-        assert "2" in str(line_info)  # Should be line 2
+def test_process_markdown_cell(display_pattern):
+    """Test that non-code cells are not checked."""
+    cell = SimpleNamespace(cell_type="markdown", source="display(df)")
 
-    finally:
-        os.unlink(temp_path)
+    assert _process_notebook_cell(cell, 0, display_pattern) == []
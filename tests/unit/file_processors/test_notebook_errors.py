@@ -1,65 +1,39 @@
-import pytest
-import tempfile
-import os
 import json
-from pathlib import Path
-
-from sparkgrep.file_processors import check_notebook_file
-
-
-def create_test_notebook(cells):
-    """Helper function to create a test notebook with given cells."""
-    notebook = {
-        "nbformat": 4,
-        "nbformat_minor": 4,
-        "metadata": {},
-        "cells": cells
-    }
-    return notebook
-
+import os
+from functools import lru_cache
 
-def test_check_notebook_file_invalid_json():
-    """Test handling of invalid JSON files."""
-    invalid_json = "{ invalid json content"
-    patterns = [(r"display\(", "display function")]
+import pytest
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        f.write(invalid_json)
-        temp_path = f.name
+from sparkgrep.file_processors import check_notebook_file, check_notebook_source
 
-    try:
-        issues = check_notebook_file(Path(temp_path), patterns)
-        # Should handle gracefully and return empty list
-        assert len(issues) == 0
 
-    finally:
-        os.unlink(temp_path)
+# Very long comment line, built once at import
+_LONG_LINE = "# " + "x" * 10000 + "\n"
 
 
-def test_check_notebook_file_missing_cells():
-    """Test handling of notebook without cells key."""
-    invalid_notebook = {
-        "nbformat": 4,
-        "nbformat_minor": 4,
-        "metadata": {}
+@pytest.mark.parametrize(
+    "source",
+    [
+        "{ invalid json content",
         # Missing "cells" key
-    }
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(invalid_notebook, f)
-        temp_path = f.name
-
-    try:
-        issues = check_notebook_file(Path(temp_path), patterns)
-        # Should handle gracefully
-        assert len(issues) == 0
-
-    finally:
-        os.unlink(temp_path)
-
-
-def test_check_notebook_file_cell_without_source():
+        json.dumps({"nbformat": 4, "nbformat_minor": 4, "metadata": {}}),
+        # nbformat should be an integer
+        json.dumps({
+            "nbformat": "invalid",
+            "cells": [{"cell_type": "code", "source": ["display(df)\n"]}]
+        }),
+        json.dumps({
+            "nbformat": 4, "nbformat_minor": 4, "metadata": {}, "cells": []
+        }),
+    ],
+    ids=["invalid-json", "missing-cells", "corrupted-nbformat", "empty-cells"],
+)
+def test_check_notebook_source_graceful_failure(display_pattern, source):
+    """Test that unusable notebooks give no issues instead of raising."""
+    assert check_notebook_source(source, display_pattern) == []
+
+
+def test_check_notebook_source_cell_without_source(make_notebook, display_pattern):
     """Test handling of cells without source key."""
     cells = [
         {
@@ -76,29 +50,23 @@ def test_check_notebook_file_cell_without_source():
         }
     ]
 
-    notebook = create_test_notebook(cells)
-    patterns = [(r"display\(", "display function")]
+    notebook = make_notebook(cells)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook, f)
-        temp_path = f.name
+    source = json.dumps(notebook)
 
-    try:
-        issues = check_notebook_file(Path(temp_path), patterns)
-
-        # Should find the pattern in the valid cell
-        assert len(issues) == 1
-        assert issues[0][1] == "display function"
+    issues = check_notebook_source(source, display_pattern)
 
-    finally:
-        os.unlink(temp_path)
+    # Should find the pattern in the valid cell
+    assert len(issues) == 1
+    assert issues[0][1] == "display function"
 
 
-def test_check_notebook_file_large_notebook():
-    """Test processing a large notebook."""
+@lru_cache(maxsize=None)
+def large_test_cells(ncells):
+    """Cells with a display() call in every 10th one, built once per size."""
     # Create many cells with occasional patterns
     cells = []
-    for i in range(100):
+    for i in range(ncells):
         if i % 10 == 0:
             source = [f"display(df_{i})  # Cell {i}\n"]
         else:
@@ -110,28 +78,30 @@ def test_check_notebook_file_large_notebook():
             "source": source
         })
 
-    notebook = create_test_notebook(cells)
-    patterns = [(r"display\(", "display function")]
+    return cells
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook, f)
-        temp_path = f.name
 
-    try:
-        issues = check_notebook_file(Path(temp_path), patterns)
+@pytest.mark.parametrize(
+    "ncells", [10, 100, pytest.param(1000, marks=pytest.mark.slow)]
+)
+def test_check_notebook_file_large_notebook(
+    write_notebook, make_notebook, display_pattern, ncells
+):
+    """Test processing a large notebook."""
+    temp_path = write_notebook(make_notebook(large_test_cells(ncells)))
 
-        # Should find 10 display calls (every 10th cell starting from 0)
-        assert len(issues) == 10
+    issues = check_notebook_file(temp_path, display_pattern)
 
-        # All should be display functions
-        descriptions = [issue[1] for issue in issues]
-        assert all(desc == "display function" for desc in descriptions)
+    # Should find a display call in every 10th cell starting from 0
+    assert len(issues) == ncells // 10
+
+    # All should be display functions
+    descriptions = [issue[1] for issue in issues]
+    assert all(desc == "display function" for desc in descriptions)
 
-    finally:
-        os.unlink(temp_path)
 
 @pytest.mark.skip(reason = "Test is failing. Fix later. Pattern is not matching.")
-def test_check_notebook_file_malformed_cells():
+def test_check_notebook_source_malformed_cells(make_notebook, display_pattern):
     """Test handling of malformed cells."""
     cells = [
         {
@@ -151,108 +121,40 @@ def test_check_notebook_file_malformed_cells():
         }
     ]
 
-    notebook = create_test_notebook(cells)
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook, f)
-        temp_path = f.name
+    notebook = make_notebook(cells)
 
-    try:
-        issues = check_notebook_file(Path(temp_path), patterns)
-
-        # Should handle malformed cells gracefully and process valid ones
-        assert len(issues) >= 1  # At least the good cell should be processed
-
-    finally:
-        os.unlink(temp_path)
-
-
-def test_check_notebook_file_corrupted_notebook():
-    """Test handling of corrupted notebook structure."""
-    corrupted_notebook = {
-        "nbformat": "invalid",  # Should be integer
-        "cells": [
-            {
-                "cell_type": "code",
-                "source": ["display(df)\n"]
-            }
-        ]
-    }
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(corrupted_notebook, f)
-        temp_path = f.name
-
-    try:
-        issues = check_notebook_file(Path(temp_path), patterns)
-
-        # Should handle gracefully - may or may not find patterns depending on implementation
-        assert isinstance(issues, list)
-
-    finally:
-        os.unlink(temp_path)
-
-
-def test_check_notebook_file_empty_cells_array():
-    """Test handling of notebook with empty cells array."""
-    notebook = {
-        "nbformat": 4,
-        "nbformat_minor": 4,
-        "metadata": {},
-        "cells": []  # Empty cells array
-    }
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook, f)
-        temp_path = f.name
+    source = json.dumps(notebook)
 
-    try:
-        issues = check_notebook_file(Path(temp_path), patterns)
-
-        # Should handle empty cells gracefully
-        assert len(issues) == 0
+    issues = check_notebook_source(source, display_pattern)
 
-    finally:
-        os.unlink(temp_path)
+    # Should handle malformed cells gracefully and process valid ones
+    assert len(issues) >= 1  # At least the good cell should be processed
 
 
-def test_check_notebook_file_very_long_lines():
+def test_check_notebook_source_very_long_lines(make_notebook, display_pattern):
     """Test handling of cells with very long lines."""
-    # Create a very long line
-    long_line = "# " + "x" * 10000 + "\n"
-
     cells = [
         {
             "cell_type": "code",
             "metadata": {},
             "source": [
-                long_line,
+                _LONG_LINE,
                 "display(df)  # Should still be found\n"
             ]
         }
     ]
 
-    notebook = create_test_notebook(cells)
-    patterns = [(r"display\(", "display function")]
+    notebook = make_notebook(cells)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook, f)
-        temp_path = f.name
+    source = json.dumps(notebook)
 
-    try:
-        issues = check_notebook_file(Path(temp_path), patterns)
-
-        assert len(issues) == 1
-        assert issues[0][1] == "display function"
+    issues = check_notebook_source(source, display_pattern)
 
-    finally:
-        os.unlink(temp_path)
+    assert len(issues) == 1
+    assert issues[0][1] == "display function"
 
 
-def test_check_notebook_file_binary_content():
+def test_check_notebook_source_binary_content(make_notebook, display_pattern):
     """Test handling of notebook with binary content."""
     # Try to create a notebook with binary content in source
     cells = [
@@ -263,25 +165,24 @@ def test_check_notebook_file_binary_content():
         }
     ]
 
-    notebook = create_test_notebook(cells)
-    patterns = [(r"display\(", "display function")]
+    notebook = make_notebook(cells)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook, f)
-        temp_path = f.name
+    source = json.dumps(notebook)
 
-    try:
-        issues = check_notebook_file(Path(temp_path), patterns)
-
-        # Should handle normally since we have valid content
-        assert len(issues) == 1
-        assert issues[0][1] == "display function"
+    issues = check_notebook_source(source, display_pattern)
 
-    finally:
-        os.unlink(temp_path)
+    # Should handle normally since we have valid content
+    assert len(issues) == 1
+    assert issues[0][1] == "display function"
 
 
-def test_check_notebook_file_permission_errors():
+@pytest.mark.skipif(
+    hasattr(os, "geteuid") and os.geteuid() == 0,
+    reason="chmod 0o000 does not restrict reads for root",
+)
+def test_check_notebook_file_permission_errors(
+    make_notebook, write_notebook, display_pattern
+):
     """Test handling when file cannot be read due to permissions."""
     cells = [
         {
@@ -291,29 +192,25 @@ def test_check_notebook_file_permission_errors():
         }
     ]
 
-    notebook = create_test_notebook(cells)
-    patterns = [(r"display\(", "display function")]
+    notebook = make_notebook(cells)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook, f)
-        temp_path = f.name
+    temp_path = write_notebook(notebook)
 
     try:
         # Remove read permissions
         os.chmod(temp_path, 0o000)
 
-        issues = check_notebook_file(Path(temp_path), patterns)
+        issues = check_notebook_file(temp_path, display_pattern)
 
         # Should handle permission errors gracefully
         assert isinstance(issues, list)
 
     finally:
-        # Restore permissions for cleanup
+        # Restore permissions so tmp_path can be cleaned up
         os.chmod(temp_path, 0o644)
-        os.unlink(temp_path)
 
 
-def test_check_notebook_file_nested_structures():
+def test_check_notebook_source_nested_structures(make_notebook, display_pattern):
     """Test handling of deeply nested JSON structures in cells."""
     cells = [
         {
@@ -329,19 +226,12 @@ def test_check_notebook_file_nested_structures():
         }
     ]
 
-    notebook = create_test_notebook(cells)
-    patterns = [(r"display\(", "display function")]
+    notebook = make_notebook(cells)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ipynb", delete=False) as f:
-        json.dump(notebook, f)
-        temp_path = f.name
+    source = json.dumps(notebook)
 
-    try:
-        issues = check_notebook_file(Path(temp_path), patterns)
-
-        # Should handle nested metadata and still find patterns
-        assert len(issues) == 1
-        assert issues[0][1] == "display function"
+    issues = check_notebook_source(source, display_pattern)
 
-    finally:
-        os.unlink(temp_path)
+    # Should handle nested metadata and still find patterns
+    assert len(issues) == 1
+    assert issues[0][1] == "display function"
@@ -1,12 +1,9 @@
-import pytest
-import tempfile
-import os
-from pathlib import Path
+from collections import Counter
 
 from sparkgrep.file_processors import check_python_file
 
 
-def test_check_python_file_nested_functions():
+def test_check_python_file_nested_functions(tmp_path, show_patterns):
     """Test with nested functions and classes."""
     python_code = """
 class DataProcessor:
@@ -26,28 +23,17 @@ class DataProcessor:
         self.data.show()  # Should be found
 """
 
-    patterns = [
-        (r"display\(", "display function"),
-        (r"\.show\(", "show method")
-    ]
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    issues = check_python_file(temp_path, show_patterns)
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
-
-        assert len(issues) == 3
-        descriptions = [issue[1] for issue in issues]
-        assert descriptions.count("display function") == 2
-        assert descriptions.count("show method") == 1
+    assert Counter(issue[1] for issue in issues) == Counter(
+        {"display function": 2, "show method": 1}
+    )
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_check_python_file_decorators():
+def test_check_python_file_decorators(tmp_path, show_patterns):
     """Test that decorators don't interfere with pattern detection."""
     python_code = """
 @decorator
@@ -64,28 +50,17 @@ def static_method():
     display(result)  # Should be found
 """
 
-    patterns = [
-        (r"display\(", "display function"),
-        (r"\.show\(", "show method")
-    ]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
-
-        assert len(issues) == 3
-        descriptions = [issue[1] for issue in issues]
-        assert descriptions.count("display function") == 2
-        assert descriptions.count("show method") == 1
+    issues = check_python_file(temp_path, show_patterns)
 
-    finally:
-        os.unlink(temp_path)
+    assert Counter(issue[1] for issue in issues) == Counter(
+        {"display function": 2, "show method": 1}
+    )
 
 
-def test_check_python_file_import_statements():
+def test_check_python_file_import_statements(tmp_path, display_pattern):
     """Test that import statements are handled correctly."""
     python_code = """
 import display_module
@@ -98,28 +73,21 @@ def main():
     show_data.display(df2)  # Should be found
 """
 
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-        # Should find the function calls but not the import statements
-        assert len(issues) == 2
+    issues = check_python_file(temp_path, display_pattern)
 
-        # All found issues should be function calls, not imports
-        for issue in issues:
-            assert "import" not in issue[2].lower()
-            assert "from" not in issue[2].lower()
+    # Should find the function calls but not the import statements
+    assert len(issues) == 2
 
-    finally:
-        os.unlink(temp_path)
+    # All found issues should be function calls, not imports
+    for issue in issues:
+        assert "import" not in issue[2].lower()
+        assert "from" not in issue[2].lower()
 
 
-def test_check_python_file_large_file():
+def test_check_python_file_large_file(tmp_path, display_pattern):
     """Test processing a large Python file."""
     # Create a large file with patterns scattered throughout
     lines = []
@@ -130,28 +98,22 @@ def test_check_python_file_large_file():
             lines.append(f"# Comment line {i}")
 
     python_code = "\n".join(lines)
-    patterns = [(r"display\(", "display function")]
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    issues = check_python_file(temp_path, display_pattern)
 
-        # Should find 10 display calls (every 100th line starting from 0)
-        assert len(issues) == 10
+    # Should find 10 display calls (every 100th line starting from 0)
+    assert len(issues) == 10
 
-        # Check that line numbers are correct
-        line_numbers = [issue[0] for issue in issues]
-        expected_lines = [i + 1 for i in range(0, 1000, 100)]  # +1 for 1-based indexing
-        assert line_numbers == expected_lines
-
-    finally:
-        os.unlink(temp_path)
+    # Check that line numbers are correct
+    line_numbers = [issue[0] for issue in issues]
+    expected_lines = [i + 1 for i in range(0, 1000, 100)]  # +1 for 1-based indexing
+    assert line_numbers == expected_lines
 
 
-def test_check_python_file_deeply_nested_structures():
+def test_check_python_file_deeply_nested_structures(tmp_path, show_patterns):
     """Test with deeply nested class and function structures."""
     python_code = """
 class OuterClass:
@@ -171,28 +133,17 @@ class OuterClass:
             self.data.show()  # Should be found
 """
 
-    patterns = [
-        (r"display\(", "display function"),
-        (r"\.show\(", "show method")
-    ]
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    issues = check_python_file(temp_path, show_patterns)
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
-
-        assert len(issues) == 3
-        descriptions = [issue[1] for issue in issues]
-        assert descriptions.count("display function") == 2
-        assert descriptions.count("show method") == 1
+    assert Counter(issue[1] for issue in issues) == Counter(
+        {"display function": 2, "show method": 1}
+    )
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_check_python_file_async_functions():
+def test_check_python_file_async_functions(tmp_path, show_patterns):
     """Test with async functions and await statements."""
     python_code = """
 import asyncio
@@ -214,28 +165,17 @@ class AsyncProcessor:
         self.data.show()  # Should be found
 """
 
-    patterns = [
-        (r"display\(", "display function"),
-        (r"\.show\(", "show method")
-    ]
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    issues = check_python_file(temp_path, show_patterns)
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    assert Counter(issue[1] for issue in issues) == Counter(
+        {"display function": 2, "show method": 1}
+    )
 
-        assert len(issues) == 3
-        descriptions = [issue[1] for issue in issues]
-        assert descriptions.count("display function") == 2
-        assert descriptions.count("show method") == 1
 
-    finally:
-        os.unlink(temp_path)
-
-
-def test_check_python_file_generators_and_comprehensions():
+def test_check_python_file_generators_and_comprehensions(tmp_path, display_pattern):
     """Test with generators, list comprehensions, and lambda functions."""
     python_code = """
 def generator_function():
@@ -258,27 +198,20 @@ def comprehension_test():
     display(final_result)  # Should be found
 """
 
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-        # Should find at least the clear function calls
-        assert len(issues) >= 2
+    issues = check_python_file(temp_path, display_pattern)
 
-        # Check that we find the obvious ones
-        code_lines = [issue[2] for issue in issues]
-        assert any("final_result" in line for line in code_lines)
+    # Should find at least the clear function calls
+    assert len(issues) >= 2
 
-    finally:
-        os.unlink(temp_path)
+    # Check that we find the obvious ones
+    code_lines = [issue[2] for issue in issues]
+    assert any("final_result" in line for line in code_lines)
 
 
-def test_check_python_file_exception_handling():
+def test_check_python_file_exception_handling(tmp_path, show_patterns):
     """Test with try/except blocks and exception handling."""
     python_code = """
 def handle_exceptions():
@@ -295,28 +228,17 @@ def handle_exceptions():
         display(cleanup_info)  # Should be found
 """
 
-    patterns = [
-        (r"display\(", "display function"),
-        (r"\.show\(", "show method")
-    ]
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    issues = check_python_file(temp_path, show_patterns)
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    assert Counter(issue[1] for issue in issues) == Counter(
+        {"display function": 3, "show method": 1}
+    )
 
-        assert len(issues) == 4
-        descriptions = [issue[1] for issue in issues]
-        assert descriptions.count("display function") == 3
-        assert descriptions.count("show method") == 1
-
-    finally:
-        os.unlink(temp_path)
 
-
-def test_check_python_file_context_managers():
+def test_check_python_file_context_managers(tmp_path, display_pattern):
     """Test with context managers and with statements."""
     python_code = """
 def context_manager_test():
@@ -335,26 +257,19 @@ def context_manager_test():
             display(entity)  # Should be found
 """
 
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    issues = check_python_file(temp_path, display_pattern)
 
-        assert len(issues) == 3
+    assert len(issues) == 3
 
-        # All should be display functions
-        descriptions = [issue[1] for issue in issues]
-        assert all(desc == "display function" for desc in descriptions)
-
-    finally:
-        os.unlink(temp_path)
+    # All should be display functions
+    descriptions = [issue[1] for issue in issues]
+    assert all(desc == "display function" for desc in descriptions)
 
 
-def test_check_python_file_multiple_inheritance():
+def test_check_python_file_multiple_inheritance(tmp_path, show_patterns):
     """Test with multiple inheritance and complex class hierarchies."""
     python_code = """
 class BaseProcessor:
@@ -376,22 +291,11 @@ class ComplexProcessor(BaseProcessor, Mixin):
         self.mixin_method()
 """
 
-    patterns = [
-        (r"display\(", "display function"),
-        (r"\.show\(", "show method")
-    ]
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    issues = check_python_file(temp_path, show_patterns)
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
-
-        assert len(issues) == 3
-        descriptions = [issue[1] for issue in issues]
-        assert descriptions.count("display function") == 2
-        assert descriptions.count("show method") == 1
-
-    finally:
-        os.unlink(temp_path)
+    assert Counter(issue[1] for issue in issues) == Counter(
+        {"display function": 2, "show method": 1}
+    )
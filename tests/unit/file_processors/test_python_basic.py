@@ -1,12 +1,9 @@
-import pytest
-import tempfile
-import os
 from pathlib import Path
 
 from sparkgrep.file_processors import check_python_file
 
 
-def test_check_python_file_with_matches():
+def test_check_python_file_with_matches(tmp_path, show_patterns):
     """Test checking a Python file that contains pattern matches."""
     python_code = """
 def process_data():
@@ -20,34 +17,24 @@ def process_data():
     return df
 """
 
-    patterns = [
-        (r"display\(", "display function"),
-        (r"\.show\(", "show method")
-    ]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    issues = check_python_file(temp_path, show_patterns)
 
-        assert len(issues) == 2
+    assert len(issues) == 2
 
-        # Check that both patterns were found
-        descriptions = [issue[1] for issue in issues]
-        assert "display function" in descriptions
-        assert "show method" in descriptions
+    # Check that both patterns were found
+    descriptions = [issue[1] for issue in issues]
+    assert "display function" in descriptions
+    assert "show method" in descriptions
 
-        # Check line numbers are reasonable
-        line_numbers = [issue[0] for issue in issues]
-        assert all(line_num > 0 for line_num in line_numbers)
+    # Check line numbers are reasonable
+    line_numbers = [issue[0] for issue in issues]
+    assert all(line_num > 0 for line_num in line_numbers)
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_check_python_file_no_matches():
+def test_check_python_file_no_matches(tmp_path, show_patterns):
     """Test checking a Python file with no pattern matches."""
     python_code = """
 def clean_function():
@@ -64,32 +51,21 @@ class CleanClass:
         return self.value
 """
 
-    patterns = [
-        (r"display\(", "display function"),
-        (r"\.show\(", "show method")
-    ]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
-        assert len(issues) == 0
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    finally:
-        os.unlink(temp_path)
+    issues = check_python_file(temp_path, show_patterns)
+    assert len(issues) == 0
 
 
-def test_check_python_file_nonexistent():
+def test_check_python_file_nonexistent(display_pattern):
     """Test handling of nonexistent Python files."""
-    patterns = [(r"display\(", "display function")]
 
-    issues = check_python_file(Path("nonexistent_file.py"), patterns)
+    issues = check_python_file(Path("nonexistent_file.py"), display_pattern)
     assert len(issues) == 0
 
 
-def test_check_python_file_empty_patterns():
+def test_check_python_file_empty_patterns(tmp_path):
     """Test with empty patterns list."""
     python_code = """
 def test_function():
@@ -99,53 +75,36 @@ def test_function():
 
     patterns = []  # Empty patterns list
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
-        assert len(issues) == 0
-
-    finally:
-        os.unlink(temp_path)
+    issues = check_python_file(temp_path, patterns)
+    assert len(issues) == 0
 
 
-def test_check_python_file_empty_file():
+def test_check_python_file_empty_file(tmp_path, display_pattern):
     """Test processing an empty Python file."""
     python_code = ""  # Empty file
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
-        assert len(issues) == 0
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    finally:
-        os.unlink(temp_path)
+    issues = check_python_file(temp_path, display_pattern)
+    assert len(issues) == 0
 
 
-def test_check_python_file_only_whitespace():
+def test_check_python_file_only_whitespace(tmp_path, display_pattern):
     """Test processing a file with only whitespace."""
     python_code = "   \n\t\n   \n"  # Only whitespace
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
-        assert len(issues) == 0
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    finally:
-        os.unlink(temp_path)
+    issues = check_python_file(temp_path, display_pattern)
+    assert len(issues) == 0
 
 
-def test_check_python_file_simple_patterns():
+def test_check_python_file_simple_patterns(tmp_path):
     """Test with simple regex patterns."""
     python_code = """
 simple_function()
@@ -159,24 +118,19 @@ display(df)
         (r"display", "display call")
     ]
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    issues = check_python_file(temp_path, patterns)
 
-        assert len(issues) == 3
-        descriptions = [issue[1] for issue in issues]
-        assert "simple function" in descriptions
-        assert "another call" in descriptions
-        assert "display call" in descriptions
+    assert len(issues) == 3
+    descriptions = [issue[1] for issue in issues]
+    assert "simple function" in descriptions
+    assert "another call" in descriptions
+    assert "display call" in descriptions
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_check_python_file_line_numbers():
+def test_check_python_file_line_numbers(tmp_path, display_pattern):
     """Test that line numbers are reported correctly."""
     python_code = """# Line 1
 def function():  # Line 2
@@ -184,54 +138,37 @@ def function():  # Line 2
     return True  # Line 4
 """
 
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-        assert len(issues) == 1
-        # Line number should be 3
-        line_info = issues[0][0]
-        assert "3" in str(line_info)
+    issues = check_python_file(temp_path, display_pattern)
 
-    finally:
-        os.unlink(temp_path)
+    assert len(issues) == 1
+    # Line number should be 3
+    line_info = issues[0][0]
+    assert "3" in str(line_info)
 
 
-def test_check_python_file_multiple_matches_same_line():
+def test_check_python_file_multiple_matches_same_line(tmp_path, show_patterns):
     """Test multiple pattern matches on the same line."""
     python_code = """
 # This line has multiple issues
 display(df); df.show(); display(df2)
 """
 
-    patterns = [
-        (r"display\(", "display function"),
-        (r"\.show\(", "show method")
-    ]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    issues = check_python_file(temp_path, show_patterns)
 
-        # Should find all patterns (function returns one match per pattern per line)
-        assert len(issues) >= 2
-        descriptions = [issue[1] for issue in issues]
-        assert "display function" in descriptions
-        assert "show method" in descriptions
+    # Should find all patterns (function returns one match per pattern per line)
+    assert len(issues) >= 2
+    descriptions = [issue[1] for issue in issues]
+    assert "display function" in descriptions
+    assert "show method" in descriptions
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_check_python_file_case_sensitivity():
+def test_check_python_file_case_sensitivity(tmp_path):
     """Test pattern matching case sensitivity."""
     python_code = """
 Display(df)  # Uppercase
@@ -241,15 +178,10 @@ display(df)  # Lowercase
 
     patterns = [(r"display\(", "display function")]  # Lowercase pattern
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-        # Should find matches based on pattern case sensitivity (usually case-insensitive)
-        assert len(issues) >= 1
+    issues = check_python_file(temp_path, patterns)
 
-    finally:
-        os.unlink(temp_path)
+    # Should find matches based on pattern case sensitivity (usually case-insensitive)
+    assert len(issues) >= 1
@@ -1,12 +1,9 @@
 import pytest
-import tempfile
-import os
-from pathlib import Path
 
 from sparkgrep.file_processors import check_python_file
 
 
-def test_check_python_file_skip_comments():
+def test_check_python_file_skip_comments(tmp_path, display_pattern):
     """Test that comments are properly skipped."""
     python_code = """
     def process_data():
@@ -20,27 +17,20 @@ def test_check_python_file_skip_comments():
         return df
     """
 
-    patterns = [(r"display\(", "display function")]
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    issues = check_python_file(temp_path, display_pattern)
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    # Should only find the real function call, not the commented ones
+    assert len(issues) == 1
+    assert issues[0][1] == "display function"
 
-        # Should only find the real function call, not the commented ones
-        assert len(issues) == 1
-        assert issues[0][1] == "display function"
+    # The found issue should be on the line with the actual call
+    assert "display(df)  # Real function call" in issues[0][2]
 
-        # The found issue should be on the line with the actual call
-        assert "display(df)  # Real function call" in issues[0][2]
 
-    finally:
-        os.unlink(temp_path)
-
-
-def test_check_python_file_skip_docstrings():
+def test_check_python_file_skip_docstrings(tmp_path, display_pattern):
     """Test that docstrings are properly skipped."""
     python_code = '''
     def example_function():
@@ -55,25 +45,18 @@ def test_check_python_file_skip_docstrings():
         return result
     '''
 
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    issues = check_python_file(temp_path, display_pattern)
 
-        # Should only find the actual function call, not the one in docstring
-        assert len(issues) == 1
-        assert issues[0][1] == "display function"
-        assert "This should be found" in issues[0][2]
+    # Should only find the actual function call, not the one in docstring
+    assert len(issues) == 1
+    assert issues[0][1] == "display function"
+    assert "This should be found" in issues[0][2]
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_check_python_file_multiline_docstring():
+def test_check_python_file_multiline_docstring(tmp_path, display_pattern):
     """Test handling of multiline docstrings."""
     python_code = '''
 def complex_function():
@@ -93,24 +76,18 @@ def complex_function():
     display(df)  # This should be detected
 '''
 
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    issues = check_python_file(temp_path, display_pattern)
 
-        # Should only find the actual call outside the docstring
-        assert len(issues) == 1
-        assert "This should be detected" in issues[0][2]
+    # Should only find the actual call outside the docstring
+    assert len(issues) == 1
+    assert "This should be detected" in issues[0][2]
 
-    finally:
-        os.unlink(temp_path)
 
 @pytest.mark.skip(reason = "Test is failing. Fix later. Pattern is not matching.")
-def test_check_python_file_string_literals():
+def test_check_python_file_string_literals(tmp_path, display_pattern):
     """Test that patterns in string literals are handled appropriately."""
     python_code = '''
     def test_strings():
@@ -125,27 +102,20 @@ def test_check_python_file_string_literals():
         display(actual_df)  # Real function call
     '''
 
-    patterns = [(r"display\(", "display function")]
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    issues = check_python_file(temp_path, display_pattern)
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    # Should find at least the real function call
+    assert len(issues) >= 1
 
-        # Should find at least the real function call
-        assert len(issues) >= 1
+    # Check that the real function call is found
+    real_call_found = any("actual_df" in issue[2] for issue in issues)
+    assert real_call_found
 
-        # Check that the real function call is found
-        real_call_found = any("actual_df" in issue[2] for issue in issues)
-        assert real_call_found
 
-    finally:
-        os.unlink(temp_path)
-
-
-def test_check_python_file_unicode_content():
+def test_check_python_file_unicode_content(tmp_path, display_pattern):
     """Test processing files with unicode content."""
     python_code = """
 # -*- coding: utf-8 -*-
@@ -156,26 +126,19 @@ def traiter_données():
     return df_世界
 """
 
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False, encoding="utf-8") as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code, encoding="utf-8")
 
-        assert len(issues) == 1
-        assert issues[0][1] == "display function"
+    issues = check_python_file(temp_path, display_pattern)
 
-        # Check that unicode is preserved in the line content
-        assert "df_世界" in issues[0][2]
+    assert len(issues) == 1
+    assert issues[0][1] == "display function"
 
-    finally:
-        os.unlink(temp_path)
+    # Check that unicode is preserved in the line content
+    assert "df_世界" in issues[0][2]
 
 
-def test_check_python_file_complex_patterns():
+def test_check_python_file_complex_patterns(tmp_path):
     """Test with complex regex patterns."""
     python_code = """
 def analyze_data():
@@ -193,26 +156,21 @@ def analyze_data():
         (r"display\(", "display function")
     ]
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    issues = check_python_file(temp_path, patterns)
 
-        # Should find patterns that match the criteria
-        assert len(issues) >= 3
+    # Should find patterns that match the criteria
+    assert len(issues) >= 3
 
-        descriptions = [issue[1] for issue in issues]
-        assert "collect without assignment" in descriptions
-        assert "count without assignment" in descriptions
-        assert "display function" in descriptions
+    descriptions = [issue[1] for issue in issues]
+    assert "collect without assignment" in descriptions
+    assert "count without assignment" in descriptions
+    assert "display function" in descriptions
 
-    finally:
-        os.unlink(temp_path)
 
-
-def test_check_python_file_mixed_quotes():
+def test_check_python_file_mixed_quotes(tmp_path, display_pattern):
     """Test handling of mixed quote styles."""
     python_code = """
 def mixed_quotes():
@@ -225,27 +183,20 @@ def mixed_quotes():
     display(real_df)
 """
 
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-        # Should find at least the real function call
-        assert len(issues) >= 1
+    issues = check_python_file(temp_path, display_pattern)
 
-        # Check that the real call is found
-        real_call_found = any("real_df" in issue[2] for issue in issues)
-        assert real_call_found
+    # Should find at least the real function call
+    assert len(issues) >= 1
 
-    finally:
-        os.unlink(temp_path)
+    # Check that the real call is found
+    real_call_found = any("real_df" in issue[2] for issue in issues)
+    assert real_call_found
 
 
-def test_check_python_file_escaped_quotes():
+def test_check_python_file_escaped_quotes(tmp_path, display_pattern):
     """Test handling of escaped quotes in strings."""
     python_code = '''
 def escaped_quotes():
@@ -256,27 +207,20 @@ def escaped_quotes():
     display(dataframe)
 '''
 
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-        # Should find at least the real function call
-        assert len(issues) >= 1
+    issues = check_python_file(temp_path, display_pattern)
 
-        # Check that the real call is found
-        real_call_found = any("dataframe" in issue[2] for issue in issues)
-        assert real_call_found
+    # Should find at least the real function call
+    assert len(issues) >= 1
 
-    finally:
-        os.unlink(temp_path)
+    # Check that the real call is found
+    real_call_found = any("dataframe" in issue[2] for issue in issues)
+    assert real_call_found
 
 
-def test_check_python_file_f_strings():
+def test_check_python_file_f_strings(tmp_path, display_pattern):
     """Test handling of f-strings."""
     python_code = '''
 def f_string_test():
@@ -288,27 +232,20 @@ def f_string_test():
     display(actual_data)
 '''
 
-    patterns = [(r"display\(", "display function")]
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    issues = check_python_file(temp_path, display_pattern)
 
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    # Should find at least the real function call
+    assert len(issues) >= 1
 
-        # Should find at least the real function call
-        assert len(issues) >= 1
+    # Check that the real call is found
+    real_call_found = any("actual_data" in issue[2] for issue in issues)
+    assert real_call_found
 
-        # Check that the real call is found
-        real_call_found = any("actual_data" in issue[2] for issue in issues)
-        assert real_call_found
 
-    finally:
-        os.unlink(temp_path)
-
-
-def test_check_python_file_raw_strings():
+def test_check_python_file_raw_strings(tmp_path, display_pattern):
     """Test handling of raw strings."""
     python_code = r'''
 def raw_string_test():
@@ -319,17 +256,10 @@ def raw_string_test():
     display(df)
 '''
 
-    patterns = [(r"display\(", "display function")]
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
-
-    try:
-        issues = check_python_file(Path(temp_path), patterns)
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-        # Should find at least the real function call
-        assert len(issues) >= 1
+    issues = check_python_file(temp_path, display_pattern)
 
-    finally:
-        os.unlink(temp_path)
+    # Should find at least the real function call
+    assert len(issues) >= 1
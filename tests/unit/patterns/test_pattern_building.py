@@ -8,7 +8,7 @@ def test_default_patterns_only():
 
     assert isinstance(patterns, list)
     assert len(patterns) > 0
-    assert patterns == USELESS_PATTERNS
+    assert patterns == list(USELESS_PATTERNS)
 
     # Should have the expected structure
     for pattern in patterns:
@@ -81,18 +81,29 @@ def test_additional_patterns_invalid_format():
         assert isinstance(patterns, list)
 
 
+def test_additional_patterns_invalid_regex(capsys):
+    """Test that additional patterns with invalid regex are skipped."""
+    patterns = build_patterns_list(
+        disable_default_patterns=True,
+        additional_patterns=["invalid[regex:Invalid regex", "valid:Valid pattern"]
+    )
+
+    assert patterns == [("valid", "Valid pattern")]
+    assert "Invalid regex 'invalid[regex'" in capsys.readouterr().out
+
+
 def test_additional_patterns_none():
     """Test with None additional patterns."""
     patterns = build_patterns_list(disable_default_patterns=False, additional_patterns=None)
 
-    assert patterns == USELESS_PATTERNS
+    assert patterns == list(USELESS_PATTERNS)
 
 
 def test_additional_patterns_empty_list():
     """Test with empty additional patterns list."""
     patterns = build_patterns_list(disable_default_patterns=False, additional_patterns=[])
 
-    assert patterns == USELESS_PATTERNS
+    assert patterns == list(USELESS_PATTERNS)
 
 
 def test_complex_additional_patterns():
@@ -252,7 +263,7 @@ def test_build_patterns_both_flags():
 
     # Only defaults
     patterns3 = build_patterns_list(disable_default_patterns=False, additional_patterns=None)
-    assert patterns3 == USELESS_PATTERNS
+    assert patterns3 == list(USELESS_PATTERNS)
 
     # Neither
     patterns4 = build_patterns_list(disable_default_patterns=True, additional_patterns=None)
@@ -294,4 +305,4 @@ def test_build_patterns_function_defaults():
     # Test calling with no parameters (should use defaults)
     patterns = build_patterns_list()
 
-    assert patterns == USELESS_PATTERNS
+    assert patterns == list(USELESS_PATTERNS)
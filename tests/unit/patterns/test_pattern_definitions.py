@@ -5,7 +5,7 @@ from sparkgrep.patterns import USELESS_PATTERNS
 
 def test_useless_patterns_structure():
     """Test that USELESS_PATTERNS has the correct structure."""
-    assert isinstance(USELESS_PATTERNS, list)
+    assert isinstance(USELESS_PATTERNS, tuple)
     assert len(USELESS_PATTERNS) > 0
 
     for pattern in USELESS_PATTERNS:
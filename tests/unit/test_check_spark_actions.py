@@ -2,9 +2,6 @@
 Unit tests for the check_spark_actions module.
 """
 
-import pytest
-import tempfile
-import os
 from unittest.mock import patch
 
 from sparkgrep.check_spark_actions import main
@@ -17,44 +14,34 @@ def test_module_import():
     assert callable(check_spark_actions.main)
 
 
-def test_main_function_with_real_files():
+def test_main_function_with_real_files(tmp_path):
     """Test the main function with real files containing issues."""
     python_code = "display(df)\ndf.show()"
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    try:
-        test_argv = ["check_spark_actions", temp_path]
+    test_argv = ["check_spark_actions", str(temp_path)]
 
-        with patch("sys.argv", test_argv):
-            result = main()
-
-        assert result == 1  # Should find issues
+    with patch("sys.argv", test_argv):
+        result = main()
 
-    finally:
-        os.unlink(temp_path)
+    assert result == 1  # Should find issues
 
 
-def test_main_function_clean_files():
+def test_main_function_clean_files(tmp_path):
     """Test the main function with clean files."""
     python_code = "def clean(): return sum([1, 2, 3])"
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(python_code)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(python_code)
 
-    try:
-        test_argv = ["check_spark_actions", temp_path]
+    test_argv = ["check_spark_actions", str(temp_path)]
 
-        with patch("sys.argv", test_argv):
-            result = main()
-
-        assert result == 0  # Should find no issues
+    with patch("sys.argv", test_argv):
+        result = main()
 
-    finally:
-        os.unlink(temp_path)
+    assert result == 0  # Should find no issues
 
 
 def test_main_function_no_files():
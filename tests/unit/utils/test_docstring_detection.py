@@ -1,4 +1,3 @@
-import pytest
 from sparkgrep.utils import detect_docstring_start, is_docstring_line
 
 
@@ -1,22 +1,15 @@
-import pytest
 from pathlib import Path
-import tempfile
-import os
 
 from sparkgrep.utils import read_file_safely
 
 
-def test_read_existing_file():
+def test_read_existing_file(tmp_path):
     """Test reading an existing file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write("line1\nline2\nline3\n")
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text("line1\nline2\nline3\n")
 
-    try:
-        result = read_file_safely(Path(temp_path))
-        assert result == ["line1\n", "line2\n", "line3\n"]
-    finally:
-        os.unlink(temp_path)
+    result = read_file_safely(temp_path)
+    assert result == ["line1\n", "line2\n", "line3\n"]
 
 
 def test_read_nonexistent_file():
@@ -25,97 +18,73 @@ def test_read_nonexistent_file():
     assert result == []
 
 
-def test_read_empty_file():
+def test_read_empty_file(tmp_path):
     """Test reading an empty file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.touch()
 
-    try:
-        result = read_file_safely(Path(temp_path))
-        assert result == []
-    finally:
-        os.unlink(temp_path)
+    result = read_file_safely(temp_path)
+    assert result == []
 
 
-def test_read_file_with_unicode():
+def test_read_file_with_unicode(tmp_path):
     """Test reading a file with unicode content."""
     content = "# -*- coding: utf-8 -*-\n# Comment with émojis 🚀\nprint('Hello 世界')\n"
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False, encoding="utf-8") as f:
-        f.write(content)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(content, encoding="utf-8")
 
-    try:
-        result = read_file_safely(Path(temp_path))
-        assert len(result) == 3
-        assert "émojis 🚀" in result[1]
-        assert "世界" in result[2]
-    finally:
-        os.unlink(temp_path)
+    result = read_file_safely(temp_path)
+    assert len(result) == 3
+    assert "émojis 🚀" in result[1]
+    assert "世界" in result[2]
 
 
-def test_read_file_with_different_line_endings():
+def test_read_file_with_different_line_endings(tmp_path):
     """Test reading files with different line endings."""
     content_unix = "line1\nline2\nline3\n"
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False, newline='\n') as f:
-        f.write(content_unix)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_bytes(content_unix.encode())
 
-    try:
-        result = read_file_safely(Path(temp_path))
-        assert len(result) == 3
-        assert all(line.endswith('\n') for line in result)
-    finally:
-        os.unlink(temp_path)
+    result = read_file_safely(temp_path)
+    assert len(result) == 3
+    assert all(line.endswith('\n') for line in result)
 
 
-def test_read_large_file():
+def test_read_large_file(tmp_path):
     """Test reading a large file."""
     lines = [f"line_{i}\n" for i in range(1000)]
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.writelines(lines)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text("".join(lines))
 
-    try:
-        result = read_file_safely(Path(temp_path))
-        assert len(result) == 1000
-        assert result[0] == "line_0\n"
-        assert result[999] == "line_999\n"
-    finally:
-        os.unlink(temp_path)
+    result = read_file_safely(temp_path)
+    assert len(result) == 1000
+    assert result[0] == "line_0\n"
+    assert result[999] == "line_999\n"
 
 
-def test_read_file_with_special_characters():
+def test_read_file_with_special_characters(tmp_path):
     """Test reading files with special characters in content."""
     content = "def test():\n    print('Special chars: !@#$%^&*()[]{}|\\\\;:'\\'\"')\n    return True\n"
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(content)
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text(content)
 
-    try:
-        result = read_file_safely(Path(temp_path))
-        assert len(result) == 3
-        assert "Special chars:" in result[1]
-    finally:
-        os.unlink(temp_path)
+    result = read_file_safely(temp_path)
+    assert len(result) == 3
+    assert "Special chars:" in result[1]
 
 
-def test_read_file_pathlib_path():
+def test_read_file_pathlib_path(tmp_path):
     """Test that function works with pathlib.Path objects."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write("test content\n")
-        temp_path = f.name
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_text("test content\n")
 
-    try:
-        # Test with Path object
-        path_obj = Path(temp_path)
-        result = read_file_safely(path_obj)
-        assert result == ["test content\n"]
-    finally:
-        os.unlink(temp_path)
+    # Test with Path object
+    result = read_file_safely(temp_path)
+    assert result == ["test content\n"]
 
 
 def test_read_file_permissions_handling():
@@ -125,19 +94,33 @@ def test_read_file_permissions_handling():
     assert result == []
 
 
-def test_read_file_with_bom():
+def test_read_file_with_bom(tmp_path):
     """Test reading files with BOM (Byte Order Mark)."""
     content = "print('Hello World')\n"
 
-    with tempfile.NamedTemporaryFile(mode="wb", suffix=".py", delete=False) as f:
-        # Write BOM + content
-        f.write(b'\xef\xbb\xbf' + content.encode('utf-8'))
-        temp_path = f.name
-
-    try:
-        result = read_file_safely(Path(temp_path))
-        assert len(result) == 1
-        # BOM should be handled by UTF-8 decoder
-        assert "print('Hello World')" in result[0]
-    finally:
-        os.unlink(temp_path)
+    temp_path = tmp_path / "snip.py"
+    # Write BOM + content
+    temp_path.write_bytes(b'\xef\xbb\xbf' + content.encode('utf-8'))
+
+    result = read_file_safely(temp_path)
+    assert len(result) == 1
+    # BOM should be handled by UTF-8 decoder
+    assert "print('Hello World')" in result[0]
+
+
+def test_read_file_line_separators(tmp_path):
+    """Test that only newlines split lines, as when reading a text file."""
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_bytes(b"a = 1\r\n\x0c\nb = 2\rc = 3\n")
+
+    result = read_file_safely(temp_path)
+    assert result == ["a = 1\n", "\x0c\n", "b = 2\n", "c = 3\n"]
+
+
+def test_read_file_invalid_utf8(tmp_path, capsys):
+    """Test that undecodable files are reported and skipped."""
+    temp_path = tmp_path / "snip.py"
+    temp_path.write_bytes(b"display(df)\n\xff\xfe\n")
+
+    assert read_file_safely(temp_path) == []
+    assert "encoding issues" in capsys.readouterr().out
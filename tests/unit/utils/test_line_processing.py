@@ -1,4 +1,3 @@
-import pytest
 from sparkgrep.utils import should_skip_line, should_skip_notebook_line
 
 
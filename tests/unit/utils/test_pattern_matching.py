@@ -1,10 +1,23 @@
+import re
+
 import pytest
-from sparkgrep.utils import check_line_for_patterns
+
+from sparkgrep.utils import (
+    check_line_for_patterns,
+    compile_pattern,
+    compile_union,
+    literal_prefix,
+    match_line,
+)
+
+
+# Shared by the single-pattern tests, which only read it
+DISPLAY_PATTERNS = (("display\\(", "display function"),)
 
 
 def test_single_pattern_match():
     """Test matching a single pattern."""
-    patterns = [("display\\(", "display function")]
+    patterns = DISPLAY_PATTERNS
     line = "display(df)"
 
     matches = check_line_for_patterns(line, patterns)
@@ -32,7 +45,7 @@ def test_multiple_pattern_matches():
 
 def test_no_pattern_matches():
     """Test when no patterns match."""
-    patterns = [("display\\(", "display function")]
+    patterns = DISPLAY_PATTERNS
     line = "print('Hello World')"
 
     matches = check_line_for_patterns(line, patterns)
@@ -41,7 +54,7 @@ def test_no_pattern_matches():
 
 def test_case_insensitive_matching():
     """Test case insensitive pattern matching."""
-    patterns = [("display\\(", "display function")]
+    patterns = DISPLAY_PATTERNS
     line = "DISPLAY(df)"
 
     matches = check_line_for_patterns(line, patterns)
@@ -90,7 +103,7 @@ def test_complex_regex_patterns():
 
 def test_multiple_same_pattern_matches():
     """Test multiple matches of the same pattern in one line."""
-    patterns = [("display\\(", "display function")]
+    patterns = DISPLAY_PATTERNS
     line = "display(df1); display(df2); display(df3)"
 
     matches = check_line_for_patterns(line, patterns)
@@ -124,7 +137,7 @@ def test_pattern_with_special_characters():
 
 def test_unicode_content_patterns():
     """Test pattern matching with unicode content."""
-    patterns = [("display\\(", "display function")]
+    patterns = DISPLAY_PATTERNS
     line = "display(données)  # Comment with unicode: 世界"
 
     matches = check_line_for_patterns(line, patterns)
@@ -134,7 +147,7 @@ def test_unicode_content_patterns():
 
 def test_empty_line():
     """Test pattern matching on empty line."""
-    patterns = [("display\\(", "display function")]
+    patterns = DISPLAY_PATTERNS
     line = ""
 
     matches = check_line_for_patterns(line, patterns)
@@ -143,7 +156,7 @@ def test_empty_line():
 
 def test_whitespace_only_line():
     """Test pattern matching on whitespace-only line."""
-    patterns = [("display\\(", "display function")]
+    patterns = DISPLAY_PATTERNS
     line = "   \t  \n"
 
     matches = check_line_for_patterns(line, patterns)
@@ -152,7 +165,7 @@ def test_whitespace_only_line():
 
 def test_pattern_matching_with_none_values():
     """Test pattern matching handles None values gracefully."""
-    patterns = [("display\\(", "display function")]
+    patterns = DISPLAY_PATTERNS
 
     # Test with None line (shouldn't happen in real usage, but good to be safe)
     matches = check_line_for_patterns("", patterns)
@@ -219,3 +232,124 @@ def test_invalid_regex_handling():
     # Should find the match with valid regex
     assert len(matches) == 1
     assert matches[0][0] == "escaped bracket pattern"
+
+
+def test_compile_pattern_is_cached():
+    """Test that the same pattern source compiles to a shared object."""
+    first = compile_pattern("display\\(")
+    second = compile_pattern("display\\(")
+
+    assert first is second
+    assert first.search("DISPLAY(df)")
+
+
+def test_compile_pattern_accepts_precompiled():
+    """Test that an already compiled pattern is returned unchanged."""
+    compiled = re.compile(r"display\(", re.IGNORECASE)
+
+    assert compile_pattern(compiled) == compiled
+    assert check_line_for_patterns("display(df)", [(compiled, "display function")])
+
+
+def test_compile_union_prefilter():
+    """Test that the combined pattern rejects lines matching no pattern."""
+    sources = tuple(f"function_{i}\\(" for i in range(200))
+    union = compile_union(sources)
+
+    assert union is not None
+    assert union.search("FUNCTION_199(df)")
+    assert not union.search("print(df)")
+    assert compile_union(sources) is union
+
+
+def test_compile_union_falls_back():
+    """Test that unsafe pattern sets are not combined."""
+    assert compile_union(("display\\(",)) is None
+    assert compile_union((r"(a)\1", r"(b)\1")) is None
+    assert compile_union(("display\\(", re.compile("show"))) is None
+    assert compile_union(("display\\(", re.compile("show", re.IGNORECASE))) is not None
+    assert compile_union(("(?i)display", "show")) is None
+    assert compile_union((r"(a)?(?(1)b|c)", "show")) is None
+
+
+def test_inline_flags_do_not_leak_into_other_patterns():
+    """Test that a pattern's inline flags never change another pattern."""
+    patterns = [(r"a b", "space"), (r"(?x) display \(", "verbose display")]
+
+    assert compile_union(tuple(pattern for pattern, _ in patterns)) is None
+    assert check_line_for_patterns("a b", patterns) == [("space", "a b")]
+    assert check_line_for_patterns("display(df)", patterns) == [
+        ("verbose display", "display(df)")
+    ]
+
+
+def test_unbalanced_pattern_is_not_combined():
+    """Test that a source only valid inside a group keeps raising re.error."""
+    patterns = [(r"a)|(b", "unbalanced"), (r"display\(", "display function")]
+
+    assert compile_union(tuple(pattern for pattern, _ in patterns)) is None
+    for line in ("xb", "print(df)"):
+        with pytest.raises(re.error):
+            check_line_for_patterns(line, patterns)
+
+
+def test_compile_union_names_matching_pattern():
+    """Test that the union reports which pattern matched first."""
+    union = compile_union(("display\\(", "\\.show\\(", "(?P<name>collect)"))
+
+    assert union.search("df.show(); display(df)").lastgroup == "_p1"
+    assert union.search("df.collect()").lastgroup == "_p2"
+
+
+def test_backreference_patterns_still_match():
+    """Test that back-references keep their meaning with several patterns."""
+    patterns = [(r"(a)\1", "double a"), (r"(b)\1", "double b")]
+
+    matches = check_line_for_patterns("xbbx", patterns)
+    assert matches == [("double b", "xbbx")]
+
+
+@pytest.mark.parametrize(
+    "pattern,expected",
+    [
+        (r"display\(", "display("),
+        (r"\.collect\(\)", ".collect()"),
+        ("DISPLAY", "display"),
+        ("ab*c", "a"),
+        ("abc+d", "abc"),
+        (r"\bdisplay", ""),
+        ("display|show", ""),
+        ("(?:display)", ""),
+    ],
+)
+def test_literal_prefix(pattern, expected):
+    """Test the literal text required at the start of each match."""
+    assert literal_prefix(compile_pattern(pattern)) == expected
+
+
+def test_literal_prefix_prefilter_keeps_matches():
+    """Test that lines are only rejected when the regex could not match."""
+    patterns = [(r"display\(", "display function"), (r"\.show\(", "show method")]
+
+    assert check_line_for_patterns("DISPLAY(df)", patterns) == [
+        ("display function", "DISPLAY(df)")
+    ]
+    assert check_line_for_patterns("df.show_all(); show(df)", patterns) == []
+    # Case-sensitive precompiled patterns compare against the original line
+    exact = [(re.compile("Display"), "display class")]
+    assert check_line_for_patterns("display(df)", exact) == []
+    assert check_line_for_patterns("Display(df)", exact) == [
+        ("display class", "Display(df)")
+    ]
+
+
+def test_match_line_with_prebuilt_union():
+    """Test that a union built once gives the same matches for each line."""
+    patterns = [(r"display\(", "display function"), (r"\.show\(", "show method")]
+    union = compile_union(tuple(pattern for pattern, _ in patterns))
+
+    for line in ["df.show(); display(df)", "print(df)", "DISPLAY(df)"]:
+        assert match_line(line, patterns, union) == check_line_for_patterns(
+            line, patterns
+        )
+    assert match_line("df.show()", patterns, None) == [("show method", "df.show()")]
@@ -1,6 +1,4 @@
-import pytest
 from io import StringIO
-import sys
 from contextlib import redirect_stdout
 
 from sparkgrep.utils import report_results